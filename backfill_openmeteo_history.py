@@ -12,12 +12,24 @@ and it does NOT change your existing 6-hour Open-Meteo updater.
 
 import sys
 import os
+import hashlib
+import json
 import logging
-import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+import random
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: much faster decode of the multi-MB archive payloads
+except ImportError:
+    orjson = None
 
 from openmeteo_fetcher import OpenMeteoFetcher
 from weather_fetcher import AirtableAPI
@@ -38,6 +50,27 @@ logger = logging.getLogger("openmeteo_backfill")
 # Network behavior for backfill (override via env if needed)
 BACKFILL_TIMEOUT = float(os.getenv("OM_BACKFILL_TIMEOUT", "60"))  # seconds
 BACKFILL_RETRY_DELAY = float(os.getenv("OM_BACKFILL_RETRY_DELAY_SECONDS", "10"))
+BACKFILL_CONCURRENCY = max(1, int(os.getenv("OM_BACKFILL_CONCURRENCY", "4")))
+# Transport-level retries (connection errors, 429 and 5xx) before a chunk fails
+BACKFILL_MAX_RETRIES = int(os.getenv("OM_BACKFILL_MAX_RETRIES", "10"))
+MAX_EMPTY_RETRIES = 3  # attempts before a chunk with no daily data is skipped
+SINGLE_SHOT_TIMEOUT = 300.0  # seconds; the full-range response is much larger
+MAX_RETRY_DELAY = 60.0  # seconds; cap for exponential retry backoff
+MAX_PENDING_WRITES = 2  # Airtable writes queued behind the fetch/prep loop
+# Records gathered across chunks before one Airtable update call; each call
+# re-reads the existing table, so fewer, larger calls are much cheaper.
+WRITE_BATCH_RECORDS = max(1, int(os.getenv("OM_BACKFILL_WRITE_BATCH", "500")))
+# Pause after a fetch only once the API says fewer than this many calls remain
+RATE_LIMIT_LOW_WATER = int(os.getenv("OM_BACKFILL_RATE_LIMIT_LOW_WATER", "5"))
+
+ARCHIVE_URL = "https://archive-api.open-meteo.com/v1/archive"
+
+# Archive responses for settled windows never change, so they are kept
+# on disk and re-runs skip the download. Set OM_BACKFILL_CACHE_DIR="" to disable.
+BACKFILL_CACHE_DIR = os.getenv("OM_BACKFILL_CACHE_DIR", ".om_archive_cache")
+# The archive still returns nulls for roughly the last 5 days; only windows
+# ending at least this many days ago are cached.
+ARCHIVE_SETTLE_DAYS = 7
 
 
 def parse_date(env_var: str, default: str) -> datetime:
@@ -51,58 +84,109 @@ def parse_date(env_var: str, default: str) -> datetime:
         ) from e
 
 
-def _daily_average(
-    hourly_data: Dict[str, List[Any]],
-    variable: str,
-    hourly_times: List[str],
-    target_date: str,
-):
-    """Daily average of an hourly variable for a given date."""
-    try:
-        variable_data = hourly_data.get(variable, [])
-        if not variable_data or not hourly_times:
-            return None
+def _hourly_date_ranges(hourly_times: List[str]) -> Dict[str, Tuple[int, int]]:
+    """
+    Map each YYYY-MM-DD date to its [lo, hi) index range in the hourly arrays.
 
+    Open-Meteo returns hourly timestamps sorted and contiguous per day, so a
+    single pass is enough and every daily aggregate becomes a slice.
+    """
+    ranges: Dict[str, Tuple[int, int]] = {}
+    for i, time_str in enumerate(hourly_times):
+        day = time_str[:10]
+        bounds = ranges.get(day)
+        ranges[day] = (bounds[0], i + 1) if bounds else (i, i + 1)
+    return ranges
+
+
+def _daily_average(values: List[Any], lo: int, hi: int):
+    """Average of the non-null hourly values in values[lo:hi]."""
+    try:
         total = 0.0
         count = 0
-        for i, time_str in enumerate(hourly_times):
-            if i < len(variable_data) and time_str.startswith(target_date):
-                value = variable_data[i]
-                if value is not None:
-                    total += float(value)
-                    count += 1
+        for value in values[lo:hi]:
+            if value is not None:
+                total += value
+                count += 1
 
         return (total / count) if count > 0 else None
     except Exception:
         return None
 
 
-def _daily_sum(
-    hourly_data: Dict[str, List[Any]],
-    variable: str,
-    hourly_times: List[str],
-    target_date: str,
-):
-    """Daily sum of an hourly variable for a given date."""
+def _daily_sum(values: List[Any], lo: int, hi: int):
+    """Sum of the non-null hourly values in values[lo:hi]."""
     try:
-        variable_data = hourly_data.get(variable, [])
-        if not variable_data or not hourly_times:
-            return None
-
         total = 0.0
         found = False
-        for i, time_str in enumerate(hourly_times):
-            if i < len(variable_data) and time_str.startswith(target_date):
-                value = variable_data[i]
-                if value is not None:
-                    total += float(value)
-                    found = True
+        for value in values[lo:hi]:
+            if value is not None:
+                total += value
+                found = True
 
         return total if found else None
     except Exception:
         return None
 
 
+# Hourly variables rolled up to one value per day, and how
+_DAILY_AGGREGATES = {
+    "relative_humidity_2m": _daily_average,
+    "surface_pressure": _daily_average,
+    "snow_depth": _daily_average,
+    "wind_speed_10m": _daily_average,
+    "snowfall": _daily_sum,
+}
+
+
+def _aggregate_all(
+    hourly_data: Dict[str, List[Any]],
+    hourly_times: List[str],
+    daily_times: List[str],
+) -> Dict[str, List[Any]]:
+    """
+    Compute every daily aggregate for every hourly variable up front.
+
+    Returns variable -> list of per-day values aligned with daily_times.
+    """
+    date_ranges = _hourly_date_ranges(hourly_times)
+    bounds = [date_ranges.get(date_str, (0, 0)) for date_str in daily_times]
+
+    aggregates: Dict[str, List[Any]] = {}
+    for variable, aggregate in _DAILY_AGGREGATES.items():
+        values = hourly_data.get(variable, [])
+        aggregates[variable] = [aggregate(values, lo, hi) for lo, hi in bounds]
+    return aggregates
+
+
+# Values are JSON numbers (or our own float aggregates), so no float() needed
+def _round1(v: Any) -> float:
+    return round(v, 1)
+
+
+def _round2(v: Any) -> float:
+    return round(v, 2)
+
+
+# Per-field type/rounding rules for Airtable; fields not listed pass through
+_FIELD_CLEANERS: Dict[str, Callable[[Any], Any]] = {
+    "om_temp": _round1,
+    "om_temp_f": _round1,
+    "om_humidity": _round1,
+    "om_pressure": _round1,
+    "om_wind_speed": _round1,
+    "om_wind_speed_mph": _round1,
+    "om_precipitation": _round2,
+    "om_snowfall": _round2,
+    "om_elevation": int,
+    "om_weather_code": int,
+}
+
+
+# Fields set on every record regardless of data; a day with nothing else is empty
+_NON_METRIC_FIELDS = frozenset(("datetime", "om_data_timestamp", "om_elevation"))
+
+
 def prepare_backfill_records(data: Dict) -> List[Dict]:
     """
     Prepare Airtable-ready records for historical backfill only.
@@ -110,8 +194,6 @@ def prepare_backfill_records(data: Dict) -> List[Dict]:
     This does NOT touch or reuse OpenMeteoFetcher.prepare_records, so your
     existing behavior for the 6-hour job stays exactly as-is.
     """
-    records: List[Dict] = []
-
     daily_data = data.get("daily", {})
     hourly_data = data.get("hourly", {})
     daily_times = daily_data.get("time", [])
@@ -122,7 +204,7 @@ def prepare_backfill_records(data: Dict) -> List[Dict]:
             "No daily data available from Open-Meteo archive",
             extra={"context": "OpenMeteo Backfill Prep"}
         )
-        return records
+        return []
 
     # Elevation is static for this location (549m), but we also read from API
     elevation = data.get("elevation", 549)
@@ -130,43 +212,45 @@ def prepare_backfill_records(data: Dict) -> List[Dict]:
     # "When OM data was fetched" – using current UTC time for the backfill run
     data_timestamp = datetime.utcnow().isoformat()
 
+    # All hourly-derived daily values, computed in one go per variable
+    aggregates = _aggregate_all(hourly_data, hourly_times, daily_times)
+    humidity_d = aggregates["relative_humidity_2m"]
+    pressure_d = aggregates["surface_pressure"]
+    snow_depth_d = aggregates["snow_depth"]
+    wind_speed_d = aggregates["wind_speed_10m"]
+    snowfall_d = aggregates["snowfall"]
+
+    temps_c = daily_data.get("temperature_2m_mean", [])
+    precip_list = daily_data.get("precipitation_sum", [])
+    wc_list = daily_data.get("weather_code", [])
+
+    # At most one record per day, filled in place; n counts days kept
+    records: List[Dict] = [None] * len(daily_times)
+    n = 0
     for i, date_str in enumerate(daily_times):
         # Daily mean temperature (C) and derived F
-        temps_c = daily_data.get("temperature_2m_mean", [])
         temp_c = temps_c[i] if i < len(temps_c) else None
         temp_f = (temp_c * 9.0 / 5.0 + 32.0) if temp_c is not None else None
 
         # Daily averages from hourly data
-        daily_humidity = _daily_average(
-            hourly_data, "relative_humidity_2m", hourly_times, date_str
-        )
-        daily_pressure = _daily_average(
-            hourly_data, "surface_pressure", hourly_times, date_str
-        )
-        daily_snow_depth = _daily_average(
-            hourly_data, "snow_depth", hourly_times, date_str
-        )
-        daily_wind_speed = _daily_average(
-            hourly_data, "wind_speed_10m", hourly_times, date_str
-        )
+        daily_humidity = humidity_d[i]
+        daily_pressure = pressure_d[i]
+        daily_snow_depth = snow_depth_d[i]
+        daily_wind_speed = wind_speed_d[i]
 
         # Daily sums from hourly data
-        daily_snowfall = _daily_sum(
-            hourly_data, "snowfall", hourly_times, date_str
-        )
+        daily_snowfall = snowfall_d[i]
 
         # Daily precipitation from daily data
-        precip_list = daily_data.get("precipitation_sum", [])
         daily_precip = precip_list[i] if i < len(precip_list) else None
 
         # Weather code from daily data
-        wc_list = daily_data.get("weather_code", [])
         daily_weather_code = wc_list[i] if i < len(wc_list) else None
 
         # Wind speed mph (km/h → mph)
         wind_speed_mph = None
         if daily_wind_speed is not None:
-            wind_speed_mph = float(daily_wind_speed) * 0.621371
+            wind_speed_mph = daily_wind_speed * 0.621371
 
         om_fields = {
             # This "datetime" key is what AirtableAPI uses to match existing records
@@ -188,34 +272,333 @@ def prepare_backfill_records(data: Dict) -> List[Dict]:
 
         cleaned: Dict[str, Any] = {}
         for k, v in om_fields.items():
-            if v is None:
-                cleaned[k] = None
+            clean = _FIELD_CLEANERS.get(k)
+            if v is None or clean is None:
+                cleaned[k] = v
                 continue
 
             try:
-                if k in [
-                    "om_temp", "om_temp_f", "om_humidity", "om_pressure",
-                    "om_wind_speed", "om_wind_speed_mph"
-                ]:
-                    cleaned[k] = round(float(v), 1)
-                elif k in ["om_precipitation", "om_snowfall"]:
-                    cleaned[k] = round(float(v), 2)
-                elif k in ["om_elevation", "om_weather_code"]:
-                    cleaned[k] = int(v)
-                else:
-                    cleaned[k] = v
-            except Exception:
+                cleaned[k] = clean(v)
+            except (TypeError, ValueError):
                 cleaned[k] = v
 
-        records.append(cleaned)
+        # Nothing but bookkeeping fields: skip rather than PATCH nulls
+        if all(v is None for k, v in cleaned.items() if k not in _NON_METRIC_FIELDS):
+            continue
+
+        records[n] = cleaned
+        n += 1
+
+    del records[n:]
+    skipped = len(daily_times) - n
+    if skipped:
+        logger.info(
+            "Skipped %d backfill days with no Open-Meteo values", skipped,
+            extra={"context": "OpenMeteo Backfill Prep"}
+        )
 
     logger.info(
-        f"Prepared {len(records)} Open-Meteo backfill records",
+        "Prepared %d Open-Meteo backfill records", len(records),
         extra={"context": "OpenMeteo Backfill Prep"}
     )
     return records
 
 
+def chunk_windows(
+    start_date: datetime, end_date: datetime, chunk_days: int
+) -> List[Tuple[datetime, datetime]]:
+    """Split [start_date, end_date] into consecutive inclusive windows."""
+    windows: List[Tuple[datetime, datetime]] = []
+    current_start = start_date
+    while current_start <= end_date:
+        current_end = min(current_start + timedelta(days=chunk_days - 1), end_date)
+        windows.append((current_start, current_end))
+        current_start = current_end + timedelta(days=1)
+    return windows
+
+
+def _cache_path(params: Dict[str, Any]) -> str:
+    """Cache file for an archive request, keyed by its full parameter set."""
+    key = hashlib.sha1(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+    return os.path.join(BACKFILL_CACHE_DIR, f"{key}.json")
+
+
+def _read_cached(params: Dict[str, Any]) -> Optional[Dict]:
+    if not BACKFILL_CACHE_DIR:
+        return None
+    try:
+        with open(_cache_path(params), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached(params: Dict[str, Any], raw: Dict) -> None:
+    # Recent days are still being filled in by the archive; don't freeze them
+    settled = (date.today() - timedelta(days=ARCHIVE_SETTLE_DAYS)).isoformat()
+    if not BACKFILL_CACHE_DIR or params["end_date"] > settled:
+        return
+    path = _cache_path(params)
+    try:
+        os.makedirs(BACKFILL_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(raw, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(
+            "Could not write archive cache %s: %s", path, e,
+            extra={"context": "OM Archive Cache"}
+        )
+
+
+# Archive query parameters that are the same for every request
+ARCHIVE_PARAMS_BASE: Dict[str, Any] = {
+    "hourly": (
+        "temperature_2m,relative_humidity_2m,precipitation,"
+        "snowfall,snow_depth,weather_code,surface_pressure,wind_speed_10m"
+    ),
+    "daily": (
+        "temperature_2m_max,temperature_2m_min,temperature_2m_mean,"
+        "precipitation_sum,weather_code,wind_speed_10m_max"
+    ),
+    "timezone": "America/New_York",
+}
+
+
+def _archive_params(
+    lat: float, lon: float, range_start: datetime, range_end: datetime
+) -> Dict[str, Any]:
+    return {
+        **ARCHIVE_PARAMS_BASE,
+        "latitude": lat,
+        "longitude": lon,
+        "start_date": range_start.strftime("%Y-%m-%d"),
+        "end_date": range_end.strftime("%Y-%m-%d"),
+    }
+
+
+def _retry_after_seconds(headers: Any) -> Optional[float]:
+    """Parse a numeric Retry-After header, if the server sent one."""
+    value = headers.get("Retry-After") if headers is not None else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _pacing_delay(headers: Any, sleep_seconds: float) -> float:
+    """
+    Seconds to pause after a successful fetch.
+
+    Honor Retry-After. If the API reports X-RateLimit-Remaining, pause
+    sleep_seconds only once it drops to the low-water mark. Without either
+    header (the archive API's usual success response) always pause
+    sleep_seconds, as the sequential backfill did.
+    """
+    retry_after = _retry_after_seconds(headers)
+    if retry_after is not None:
+        return retry_after
+
+    remaining = headers.get("X-RateLimit-Remaining")
+    if remaining is not None:
+        try:
+            return sleep_seconds if int(remaining) <= RATE_LIMIT_LOW_WATER else 0.0
+        except ValueError:
+            pass
+    return sleep_seconds
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for re-requesting an empty response."""
+    return min(MAX_RETRY_DELAY, BACKFILL_RETRY_DELAY * 2 ** attempt) + random.uniform(0, 1)
+
+
+def build_session(max_retries: int = BACKFILL_MAX_RETRIES) -> requests.Session:
+    """
+    Shared keep-alive session for archive calls.
+
+    The pool is sized to the fetch concurrency and blocks rather than
+    overflowing, so the whole run opens at most BACKFILL_CONCURRENCY
+    connections and every request after the first on each one skips the
+    TLS handshake.
+    Transient failures (connection errors, 429, 5xx) are retried by the
+    adapter with exponential backoff and Retry-After support; anything
+    else, such as a 400 for bad parameters, fails on the first response.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=max_retries,
+        backoff_factor=2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=BACKFILL_CONCURRENCY,
+        pool_block=True,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def _archive_request(
+    session: requests.Session, params: Dict[str, Any], timeout: float
+) -> Tuple[Dict, Any]:
+    """
+    Issue one archive API call and return (payload, response headers).
+
+    Raises requests.RequestException on HTTP failure and ValueError when the
+    response carries no daily data.
+    """
+    response = session.get(ARCHIVE_URL, params=params, timeout=timeout)
+    response.raise_for_status()
+    raw = orjson.loads(response.content) if orjson else response.json()
+
+    # Basic sanity: ensure we got daily data
+    daily = raw.get("daily", {})
+    if not daily.get("time"):
+        raise ValueError("Archive API returned empty/invalid daily data")
+
+    _write_cached(params, raw)
+    return raw, response.headers
+
+
+def fetch_archive_range(
+    session: requests.Session,
+    lat: float,
+    lon: float,
+    range_start: datetime,
+    range_end: datetime,
+) -> Optional[Dict]:
+    """
+    Fetch the whole backfill range in a single archive call.
+
+    Returns None on any failure so the caller can fall back to chunks.
+    """
+    params = _archive_params(lat, lon, range_start, range_end)
+
+    cached = _read_cached(params)
+    if cached is not None:
+        logger.info(
+            "Archive cache hit for %s → %s", params["start_date"], params["end_date"],
+            extra={"context": "OM Archive Cache"}
+        )
+        return cached
+
+    timeout = max(BACKFILL_TIMEOUT, SINGLE_SHOT_TIMEOUT)
+    logger.info(
+        "Single-shot archive request for %s → %s (timeout=%ss)",
+        params["start_date"], params["end_date"], timeout,
+        extra={"context": "OM Archive Fetch"}
+    )
+    try:
+        raw, _ = _archive_request(session, params, timeout)
+        return raw
+    except (requests.RequestException, ValueError) as e:
+        logger.warning(
+            "Single-shot archive fetch failed: %s; falling back to chunked fetches", e,
+            extra={"context": "OM Archive Fetch Retry"}
+        )
+        return None
+
+
+def fetch_archive_chunk(
+    session: requests.Session,
+    lat: float,
+    lon: float,
+    chunk_start: datetime,
+    chunk_end: datetime,
+    sleep_seconds: float,
+    stop: Optional[threading.Event] = None,
+) -> Optional[Dict]:
+    """
+    Fetch one archive window.
+
+    Runs on a worker thread. HTTP retries are handled by the session; a
+    failure that survives them raises requests.RequestException. A window
+    that keeps coming back without daily data is retried MAX_EMPTY_RETRIES
+    times and then skipped (returns None). After a successful fetch the
+    worker pauses as _pacing_delay decides. Once `stop` is set the worker
+    gives up (returns None) instead of starting another request or pause.
+    """
+    stop = stop or threading.Event()
+    if stop.is_set():
+        return None
+    logger.info(
+        "Fetching historical data for %s to %s", chunk_start.date(), chunk_end.date(),
+        extra={"context": "OM Archive Fetch"}
+    )
+
+    params = _archive_params(lat, lon, chunk_start, chunk_end)
+
+    cached = _read_cached(params)
+    if cached is not None:
+        logger.info(
+            "Archive cache hit for %s → %s", params["start_date"], params["end_date"],
+            extra={"context": "OM Archive Cache"}
+        )
+        return cached
+
+    for attempt in range(MAX_EMPTY_RETRIES):
+        if attempt:
+            delay = _retry_delay(attempt - 1)
+            logger.warning(
+                "Archive API returned empty/invalid daily data; retrying in %.1fs", delay,
+                extra={"context": "OM Archive Fetch Retry"}
+            )
+            if stop.wait(delay):
+                return None
+
+        logger.info(
+            "Archive API request for %s → %s (timeout=%ss)",
+            params["start_date"], params["end_date"], BACKFILL_TIMEOUT,
+            extra={"context": "OM Archive Fetch"}
+        )
+        try:
+            raw, headers = _archive_request(session, params, BACKFILL_TIMEOUT)
+            break
+        except ValueError:
+            continue
+    else:
+        logger.error(
+            "No daily data for %s → %s after %d attempts; skipping this window",
+            params["start_date"], params["end_date"], MAX_EMPTY_RETRIES,
+            extra={"context": "OM Archive Fetch Error"}
+        )
+        return None
+
+    pause = _pacing_delay(headers, sleep_seconds)
+    if pause:
+        logger.info(
+            "Pacing archive requests; pausing %.1fs", pause,
+            extra={"context": "OM Archive Fetch"}
+        )
+        stop.wait(pause)
+    return raw
+
+
+def _finish_write(future: Future) -> bool:
+    """Wait for a queued Airtable write; False means the backfill must stop."""
+    try:
+        success = future.result()
+    except Exception as e:
+        logger.error(
+            "Airtable update failed: %s", e,
+            extra={"context": "Airtable Update Error"}
+        )
+        return False
+
+    if not success:
+        logger.warning(
+            "Airtable update returned falsy status",
+            extra={"context": "Airtable Update Warning"}
+        )
+    return True
+
+
 def main() -> bool:
     """
     Run a historical backfill from Open-Meteo archive API.
@@ -223,8 +606,13 @@ def main() -> bool:
     Defaults (override via GitHub env or shell env):
       OM_BACKFILL_START = 2021-01-01
       OM_BACKFILL_END   = 2025-06-21  (day before your first OM record)
-      OM_BACKFILL_CHUNK_DAYS = 30
-      OM_BACKFILL_SLEEP_SECONDS = 5
+      OM_BACKFILL_SINGLE_SHOT = 1     (one request for the whole range first)
+      OM_BACKFILL_CHUNK_DAYS = 30     (chunked fallback)
+      OM_BACKFILL_SLEEP_SECONDS = 5   (pause after each archive request)
+      OM_BACKFILL_CONCURRENCY = 4     (archive fetches in flight at once)
+      OM_BACKFILL_MAX_RETRIES = 10    (HTTP retries per chunk before failing)
+      OM_BACKFILL_WRITE_BATCH = 500   (records per Airtable update call)
+      OM_BACKFILL_CACHE_DIR = .om_archive_cache  ("" disables the cache)
     """
     start_date = parse_date("OM_BACKFILL_START", "2021-01-01")
     end_date = parse_date("OM_BACKFILL_END", "2025-06-21")
@@ -238,121 +626,125 @@ def main() -> bool:
 
     chunk_days = int(os.getenv("OM_BACKFILL_CHUNK_DAYS", "30"))
     sleep_seconds = float(os.getenv("OM_BACKFILL_SLEEP_SECONDS", "5"))
+    single_shot = os.getenv("OM_BACKFILL_SINGLE_SHOT", "1") == "1"
 
     logger.info(
-        f"Starting Open-Meteo historical backfill from "
-        f"{start_date.date()} to {end_date.date()} using {chunk_days}-day chunks",
+        "Starting Open-Meteo historical backfill from %s to %s",
+        start_date.date(), end_date.date(),
         extra={"context": "Backfill Start"}
     )
 
     # Only using this to get lat/lon; not touching its prepare_records
     om_fetcher = OpenMeteoFetcher()
+    lat, lon = om_fetcher.lat, om_fetcher.lon
     airtable = AirtableAPI()
 
-    current_start = start_date
-
-    while current_start <= end_date:
-        current_end = min(current_start + timedelta(days=chunk_days - 1), end_date)
+    session = build_session()
+    pool = ThreadPoolExecutor(max_workers=BACKFILL_CONCURRENCY)
+    # Set on the way out so fetch workers stop retrying and pausing
+    stop = threading.Event()
+    # Airtable writes run on their own thread, in order, so the next
+    # chunk can be prepared while the previous one is being written.
+    writer = ThreadPoolExecutor(max_workers=1)
+    pending: Deque[Future] = deque()
+    buffer: List[Dict] = []
+
+    def flush(final: bool = False) -> bool:
+        """
+        Queue the buffered records as Airtable updates of at most
+        WRITE_BATCH_RECORDS each. A short remainder stays buffered for the
+        next chunk unless final is set.
+        """
+        nonlocal buffer
+        while len(buffer) >= WRITE_BATCH_RECORDS or (final and buffer):
+            # Slicing hands the writer its own list; never mutate a list the
+            # writer thread may still be reading.
+            batch, buffer = buffer[:WRITE_BATCH_RECORDS], buffer[WRITE_BATCH_RECORDS:]
+            logger.info(
+                "Updating Airtable with %d records for %s → %s",
+                len(batch), batch[0]["datetime"], batch[-1]["datetime"],
+                extra={"context": "Airtable Write"}
+            )
+            pending.append(writer.submit(airtable.update_records_with_openmeteo, batch))
+            if len(pending) >= MAX_PENDING_WRITES and not _finish_write(pending.popleft()):
+                return False
+        return True
 
-        logger.info(
-            f"Fetching historical data for {current_start.date()} to {current_end.date()}",
-            extra={"context": "OM Archive Fetch"}
-        )
+    try:
+        full_raw = None
+        if single_shot:
+            # No transport retries here: any failure just means "use chunks"
+            probe = build_session(max_retries=0)
+            try:
+                full_raw = fetch_archive_range(
+                    probe, lat, lon, start_date, end_date
+                )
+            finally:
+                probe.close()
+
+        if full_raw is not None:
+            results = iter([full_raw])
+        else:
+            windows = chunk_windows(start_date, end_date, chunk_days)
+            logger.info(
+                "Fetching %d %d-day chunks (%d concurrent fetches)",
+                len(windows), chunk_days, BACKFILL_CONCURRENCY,
+                extra={"context": "OM Archive Fetch"}
+            )
+            # Archive fetches run concurrently; Airtable writes stay sequential
+            # and in window order as each fetch result is consumed.
+            futures = [
+                pool.submit(
+                    fetch_archive_chunk,
+                    session, lat, lon,
+                    chunk_start, chunk_end, sleep_seconds, stop,
+                )
+                for chunk_start, chunk_end in windows
+            ]
+            results = (future.result() for future in futures)
 
-        # Infinite retry loop for this chunk: never skip
-        params = {
-            "latitude": om_fetcher.lat,
-            "longitude": om_fetcher.lon,
-            "hourly": (
-                "temperature_2m,relative_humidity_2m,precipitation,"
-                "snowfall,snow_depth,weather_code,surface_pressure,wind_speed_10m"
-            ),
-            "daily": (
-                "temperature_2m_max,temperature_2m_min,temperature_2m_mean,"
-                "precipitation_sum,weather_code,wind_speed_10m_max"
-            ),
-            "timezone": "America/New_York",
-            "start_date": current_start.strftime("%Y-%m-%d"),
-            "end_date": current_end.strftime("%Y-%m-%d"),
-        }
+        for raw in results:
+            if raw is None:
+                continue  # window skipped by fetch_archive_chunk
 
-        while True:
             try:
-                logger.info(
-                    f"Archive API request for {params['start_date']} → {params['end_date']} "
-                    f"(timeout={BACKFILL_TIMEOUT}s)",
-                    extra={"context": "OM Archive Fetch"}
-                )
-                response = requests.get(
-                    "https://archive-api.open-meteo.com/v1/archive",
-                    params=params,
-                    timeout=BACKFILL_TIMEOUT,
+                records = prepare_backfill_records(raw)
+            except Exception as e:
+                logger.error(
+                    "Failed to prepare backfill records: %s", e,
+                    extra={"context": "Backfill Prep Error"}
                 )
-                response.raise_for_status()
-                raw = response.json()
-
-                # Basic sanity: ensure we got daily data
-                daily = raw.get("daily", {})
-                if not daily.get("time"):
-                    logger.warning(
-                        "Archive API returned empty/invalid daily data; "
-                        f"retrying in {BACKFILL_RETRY_DELAY}s",
-                        extra={"context": "OM Archive Fetch Retry"}
-                    )
-                    time.sleep(BACKFILL_RETRY_DELAY)
-                    continue
-
-                break  # success, exit retry loop
-
-            except requests.RequestException as e:
+                return False
+
+            if not records:
                 logger.warning(
-                    f"Archive fetch failed for {params['start_date']} → {params['end_date']}: {e}; "
-                    f"retrying in {BACKFILL_RETRY_DELAY}s",
-                    extra={"context": "OM Archive Fetch Retry"}
+                    "No records prepared; skipping Airtable write for this range",
+                    extra={"context": "Backfill Prep Empty"}
                 )
-                time.sleep(BACKFILL_RETRY_DELAY)
+                continue
 
-        try:
-            records = prepare_backfill_records(raw)
-        except Exception as e:
-            logger.error(
-                f"Failed to prepare backfill records: {e}",
-                extra={"context": "Backfill Prep Error"}
-            )
-            return False
+            buffer.extend(records)
+            if not flush():
+                return False
 
-        if not records:
-            logger.warning(
-                "No records prepared; skipping Airtable write for this range",
-                extra={"context": "Backfill Prep Empty"}
-            )
-            current_start = current_end + timedelta(days=1)
-            time.sleep(sleep_seconds)
-            continue
-
-        logger.info(
-            f"Updating Airtable with {len(records)} records "
-            f"for {current_start.date()} → {current_end.date()}",
-            extra={"context": "Airtable Write"}
-        )
-
-        try:
-            success = airtable.update_records_with_openmeteo(records)
-        except Exception as e:
-            logger.error(
-                f"Airtable update failed: {e}",
-                extra={"context": "Airtable Update Error"}
-            )
+        if not flush(final=True):
             return False
 
-        if not success:
-            logger.warning(
-                "Airtable update returned falsy status",
-                extra={"context": "Airtable Update Warning"}
-            )
-
-        current_start = current_end + timedelta(days=1)
-        time.sleep(sleep_seconds)
+        while pending:
+            if not _finish_write(pending.popleft()):
+                return False
+    except requests.RequestException as e:
+        logger.error(
+            "Archive fetch failed after retries: %s", e,
+            extra={"context": "OM Archive Fetch Error"}
+        )
+        return False
+    finally:
+        # Let in-flight fetches wind down before their session is closed
+        stop.set()
+        pool.shutdown(wait=True, cancel_futures=True)
+        writer.shutdown(wait=True, cancel_futures=True)
+        session.close()
 
     logger.info(
         "Historical backfill completed successfully",
@@ -31,6 +31,9 @@ Credentials / configuration (aligned to your existing system)
 
 Write controls
 - WRITE_WX=1 (default behavior if unset: WRITE)
+- Discovered entity lists and the WX record id for a date are cached on disk
+  for 24h (HA_ROLLUP_CACHE_DIR, default ~/.cache/ha_rollup); pass --no-cache
+  to force fresh lookups. DISCOVER_ENTITIES=1 always queries HA.
 - DISCOVER_ENTITIES=1: prints the discovered entity lists and exits (no Airtable write)
 
 Data quality warnings (recommended)
@@ -46,31 +49,46 @@ Airtable fields written (must exist in WX)
 
 Notes
 - Uses HA /api/history/period with minimal_response=1 and no_attributes=1
+- History is fetched one entity per request, HA_HISTORY_WORKERS (default 8) at a time
 - Ignores unknown/unavailable states
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
 import os
 import re
 import urllib.parse
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, date, time, timedelta
 from typing import Any, Dict, List, Optional, Tuple
 from zoneinfo import ZoneInfo
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # ships with Home Assistant; much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
 
 # -----------------------------
 # Defaults / constants
 # -----------------------------
 
 TZ_NAME_DEFAULT = "America/New_York"
+UTC = ZoneInfo("UTC")
 
 # Same Airtable Base ID as your existing rollup scripts
 BASE_ID_DEFAULT = "appoTbBi5JDuMvJ9D"
+# Table id of the default "WX" table (same as the thermostat rollup's TBL_WX)
+WX_TABLE_ID = "tblhUuES8IxQyoBqe"
 
 AIRT_HUM_FIELD = "HA Indoor Humidity Stats (Auto)"
 AIRT_TEMP_FIELD = "HA Indoor Temperature Stats (Auto)"
@@ -78,8 +96,16 @@ AIRT_SUMMARY_FIELD = "HA Indoor Env Summary (Auto)"
 AIRT_HUMAN_FIELD = "HA Indoor Env Human Summary (Auto)"  # NEW
 AIRT_LASTRUN_FIELD = "HA Indoor Env Last Run (Auto)"
 
-DISCOVER_HUM_RE = r"_current_humidity$"
-DISCOVER_TEMP_RE = r"_current_temperature$"
+DISCOVER_HUM_SUFFIX = "_current_humidity"
+DISCOVER_TEMP_SUFFIX = "_current_temperature"
+
+NON_NUMERIC_STATES = frozenset(("unknown", "unavailable", ""))
+
+# Small on-disk cache for lookups that rarely change (entity lists, WX ids)
+CACHE_DIR = os.path.expanduser(os.getenv("HA_ROLLUP_CACHE_DIR", "~/.cache/ha_rollup"))
+CACHE_TTL = 24 * 3600  # seconds
+
+HISTORY_WORKERS_DEFAULT = 8  # concurrent per-entity HA history requests
 
 
 # -----------------------------
@@ -93,11 +119,11 @@ class Stats:
     max: Optional[float] = None
     sum: float = 0.0
 
-    def add(self, x: float) -> None:
-        self.samples += 1
-        self.sum += x
-        self.min = x if self.min is None else min(self.min, x)
-        self.max = x if self.max is None else max(self.max, x)
+    @classmethod
+    def from_values(cls, values: List[float]) -> "Stats":
+        if not values:
+            return cls()
+        return cls(samples=len(values), min=min(values), max=max(values), sum=sum(values))
 
     def as_dict(self) -> Dict[str, Any]:
         avg = (self.sum / self.samples) if self.samples else None
@@ -123,19 +149,81 @@ def split_entities(env_name: str) -> List[str]:
     return [x.strip() for x in v.split(",") if x.strip()]
 
 
+_BEARER_RE = re.compile(r'Authorization:\s*"Bearer\s+([^\"]+)"')
+
+
+@functools.cache
 def read_token_from_config_yaml(path: str = "/config/configuration.yaml") -> Optional[str]:
     """
     Searches for: Authorization: "Bearer <token>"
+
+    Scans line by line and stops at the first match; the result is cached
+    for the life of the process.
     """
     try:
         with open(path, "r", encoding="utf-8") as f:
-            text = f.read()
-        m = re.search(r'Authorization:\s*"Bearer\s+([^\"]+)"', text)
-        return m.group(1).strip() if m else None
+            for line in f:
+                if "Authorization" not in line:
+                    continue
+                m = _BEARER_RE.search(line)
+                if m:
+                    return m.group(1).strip()
+        return None
     except Exception:
         return None
 
 
+def cache_path(kind: str, *key_parts: str) -> str:
+    key = "|".join(key_parts)
+    return os.path.join(CACHE_DIR, f"{kind}_{hashlib.sha1(key.encode()).hexdigest()[:16]}.json")
+
+
+def read_cache(path: str) -> Optional[Dict[str, Any]]:
+    """Cached entry at path, or None if missing, unreadable or older than CACHE_TTL."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        if datetime.now().timestamp() - entry["ts"] < CACHE_TTL:
+            return entry
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def write_cache(path: str, entry: Dict[str, Any]) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({**entry, "ts": datetime.now().timestamp()}, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"WARNING: could not write cache {path}: {e}")
+
+
+def wx_table_id(table: str) -> str:
+    """AIRTABLE_TABLE as a table id; the default name "WX" maps to WX_TABLE_ID."""
+    return WX_TABLE_ID if table == "WX" else table
+
+
+def wx_id_cache_path(base_id: str, table_id: str, date_field: str, target_ymd: str) -> str:
+    """
+    Cache file for a WX record id. Mirrors the thermostat rollup's
+    wx_id_cache_path (keyed on the table id) so both scripts share entries.
+    """
+    key = f"{base_id}|{table_id}|{date_field}|{target_ymd}"
+    return os.path.join(CACHE_DIR, f"wx_id_{hashlib.sha1(key.encode()).hexdigest()[:16]}.json")
+
+
+def drop_cache(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"WARNING: could not remove cache {path}: {e}")
+
+
 def local_midnight_window(target_local_date: date, tz: ZoneInfo) -> Tuple[datetime, datetime]:
     start = datetime.combine(target_local_date, time(0, 0, 0), tzinfo=tz)
     end = start + timedelta(days=1)
@@ -143,20 +231,45 @@ def local_midnight_window(target_local_date: date, tz: ZoneInfo) -> Tuple[dateti
 
 
 def to_utc_iso(dt: datetime) -> str:
-    utc = dt.astimezone(ZoneInfo("UTC"))
+    utc = dt.astimezone(UTC)
     return utc.replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+def build_session() -> requests.Session:
+    """
+    Keep-alive session shared by every HA and Airtable call in the run.
+
+    Connection errors and 429/5xx responses are retried with exponential
+    backoff (0.5s, 1s, 2s, ...), honoring Retry-After.
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "PATCH"]),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = build_session()
+
+
 def http_json(method: str, url: str, headers: Dict[str, str], body: Optional[Dict[str, Any]] = None) -> Any:
-    data = None
-    if body is not None:
-        data = json.dumps(body).encode("utf-8")
-    req = urllib.request.Request(url, method=method, data=data)
-    for k, v in headers.items():
-        req.add_header(k, v)
-    with urllib.request.urlopen(req, timeout=90) as resp:
-        raw = resp.read()
-    return json.loads(raw)
+    resp = _SESSION.request(method, url, headers=headers, json=body, timeout=90)
+    resp.raise_for_status()
+    return orjson.loads(resp.content) if orjson else resp.json()
+
+
+def dumps_compact(obj: Any) -> str:
+    """Compact JSON text for the Airtable Long text fields."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
 
 
 def ha_history_url(base: str, start_utc_iso: str, end_utc_iso: str, entities: List[str]) -> str:
@@ -176,55 +289,73 @@ def extract_numeric_state(item: Any) -> Optional[float]:
     HA history points (minimal_response) are dicts like:
       {"s": "34.2", "lu": "...", ...}
     Also handles {"state": "..."}.
-    Ignores unknown/unavailable.
+    Ignores unknown/unavailable and NaN.
     """
-    if item is None:
-        return None
-
-    s: Optional[str] = None
     if isinstance(item, dict):
-        if "s" in item:
-            s = item.get("s")
-        elif "state" in item:
-            s = item.get("state")
+        s = item["s"] if "s" in item else item.get("state")
     elif isinstance(item, (int, float, str)):
-        s = str(item)
-
-    if s is None:
+        s = item
+    else:
         return None
 
-    s2 = str(s).strip().lower()
-    if s2 in ("unknown", "unavailable", ""):
+    # Common sentinels are rejected without raising; anything else that
+    # isn't numeric (any case, surrounding whitespace) fails in float().
+    # bool is an int subclass but was never a numeric reading.
+    if s is None or isinstance(s, bool) or (isinstance(s, str) and s in NON_NUMERIC_STATES):
         return None
 
     try:
-        return float(s2)
-    except ValueError:
+        val = float(s)
+    except (TypeError, ValueError):
         return None
+    return val if val == val else None
 
 
 def compute_stats(history_payload: Any, entities: List[str]) -> Dict[str, Dict[str, Any]]:
-    stats: Dict[str, Stats] = {e: Stats() for e in entities}
+    # Raw values per entity; reduced once at the end by the C builtins
+    values: Dict[str, List[float]] = {e: [] for e in entities}
 
     if not isinstance(history_payload, list):
         raise SystemExit("ERROR: HA history response not a list")
 
     for timeline in history_payload:
-        if not isinstance(timeline, list) or not timeline:
+        # Only the first point of a timeline carries its entity_id;
+        # anything malformed just fails the lookup and is skipped
+        try:
+            bucket = values.get(timeline[0]["entity_id"])
+        except (IndexError, KeyError, TypeError):
             continue
-
-        first = timeline[0]
-        entity_id = first.get("entity_id") if isinstance(first, dict) else None
-        if not entity_id or entity_id not in stats:
+        if bucket is None:
             continue
 
         for point in timeline:
             val = extract_numeric_state(point)
-            if val is None:
-                continue
-            stats[entity_id].add(val)
+            if val is not None:
+                bucket.append(val)
+
+    return {eid: Stats.from_values(vals).as_dict() for eid, vals in values.items()}
+
+
+def fetch_ha_stats(
+    base: str,
+    start_utc_iso: str,
+    end_utc_iso: str,
+    entities: List[str],
+    headers: Dict[str, str],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch history with one request per entity, run concurrently. Each worker
+    reduces its own response to stats right away, so only the small per-entity
+    results are kept and no full history payload outlives its parse.
+    """
+    workers = max(1, int(os.getenv("HA_HISTORY_WORKERS", str(HISTORY_WORKERS_DEFAULT))))
+
+    def entity_stats(eid: str) -> Dict[str, Any]:
+        url = ha_history_url(base, start_utc_iso, end_utc_iso, [eid])
+        return compute_stats(http_json("GET", url, headers), [eid])[eid]
 
-    return {eid: st.as_dict() for eid, st in stats.items()}
+    with ThreadPoolExecutor(max_workers=min(workers, len(entities) or 1)) as pool:
+        return dict(zip(entities, pool.map(entity_stats, entities)))
 
 
 def discover_entities(ha_base: str, ha_token: str) -> Tuple[List[str], List[str]]:
@@ -234,15 +365,37 @@ def discover_entities(ha_base: str, ha_token: str) -> Tuple[List[str], List[str]
     url = ha_base.rstrip("/") + "/api/states"
     states = http_json("GET", url, headers={"Authorization": f"Bearer {ha_token}"})
 
-    temps = sorted(
-        s.get("entity_id") for s in states
-        if isinstance(s, dict) and re.search(DISCOVER_TEMP_RE, s.get("entity_id", ""))
-    )
-    hums = sorted(
-        s.get("entity_id") for s in states
-        if isinstance(s, dict) and re.search(DISCOVER_HUM_RE, s.get("entity_id", ""))
-    )
-    return [x for x in hums if x], [x for x in temps if x]
+    hums: List[str] = []
+    temps: List[str] = []
+    for s in states:
+        if not isinstance(s, dict):
+            continue
+        eid = s.get("entity_id") or ""
+        if eid.endswith(DISCOVER_HUM_SUFFIX):
+            hums.append(eid)
+        elif eid.endswith(DISCOVER_TEMP_SUFFIX):
+            temps.append(eid)
+    return sorted(hums), sorted(temps)
+
+
+def discover_entities_cached(ha_base: str, ha_token: str, use_cache: bool = True) -> Tuple[List[str], List[str]]:
+    """
+    discover_entities, reusing the previous result for CACHE_TTL. /api/states
+    returns every entity's full state, so skipping it is worth a day's lag
+    in picking up newly added sensors. An empty list (e.g. HA still starting
+    up) is never cached, so it can't stick for the whole TTL.
+    """
+    path = cache_path("entities", ha_base)
+    if use_cache:
+        cached = read_cache(path) or {}
+        hums, temps = cached.get("hum"), cached.get("temp")
+        if isinstance(hums, list) and isinstance(temps, list) and hums and temps:
+            return hums, temps
+
+    hums, temps = discover_entities(ha_base, ha_token)
+    if hums and temps:
+        write_cache(path, {"hum": hums, "temp": temps})
+    return hums, temps
 
 
 def build_warnings(stats: Dict[str, Dict[str, Any]], kind: str, min_samples: int) -> List[str]:
@@ -267,12 +420,22 @@ def _friendly_entity_name(eid: str) -> str:
 def _fmt_num(x: Any, decimals: int = 2) -> str:
     if x is None:
         return "—"
+    if type(x) is float:  # what compute_stats produces; skip the cast
+        return f"{x:.{decimals}f}"
     try:
         return f"{float(x):.{decimals}f}"
     except Exception:
         return "—"
 
 
+def _stats_line(eid: str, st: Dict[str, Any]) -> str:
+    return (
+        f"- {_friendly_entity_name(eid)}: "
+        f"min {_fmt_num(st.get('min'))}, avg {_fmt_num(st.get('avg'))}, max {_fmt_num(st.get('max'))} "
+        f"(n={int(st.get('samples') or 0)})"
+    )
+
+
 def build_human_summary(
     target_ymd: str,
     tz_name: str,
@@ -288,29 +451,16 @@ def build_human_summary(
     lines.append("")
 
     lines.append("Humidity (%)")
-    for eid in sorted(hum_stats.keys()):
-        st = hum_stats.get(eid, {}) or {}
-        lines.append(
-            f"- {_friendly_entity_name(eid)}: "
-            f"min {_fmt_num(st.get('min'))}, avg {_fmt_num(st.get('avg'))}, max {_fmt_num(st.get('max'))} "
-            f"(n={int(st.get('samples') or 0)})"
-        )
+    lines.extend(_stats_line(eid, hum_stats[eid] or {}) for eid in sorted(hum_stats))
 
     lines.append("")
     lines.append("Temperature (native units)")
-    for eid in sorted(temp_stats.keys()):
-        st = temp_stats.get(eid, {}) or {}
-        lines.append(
-            f"- {_friendly_entity_name(eid)}: "
-            f"min {_fmt_num(st.get('min'))}, avg {_fmt_num(st.get('avg'))}, max {_fmt_num(st.get('max'))} "
-            f"(n={int(st.get('samples') or 0)})"
-        )
+    lines.extend(_stats_line(eid, temp_stats[eid] or {}) for eid in sorted(temp_stats))
 
     if warnings:
         lines.append("")
         lines.append("Warnings")
-        for w in warnings:
-            lines.append(f"- {w}")
+        lines.extend(f"- {w}" for w in warnings)
 
     return "\n".join(lines).strip() + "\n"
 
@@ -319,22 +469,42 @@ def build_human_summary(
 # Airtable
 # -----------------------------
 
+@functools.lru_cache(maxsize=None)
+def airtable_table_url(base_id: str, table: str) -> str:
+    return f"https://api.airtable.com/v0/{base_id}/{urllib.parse.quote(table)}"
+
+
+def wx_date_formula(wx_date_field: str, target_ymd: str) -> str:
+    """
+    Day-level match formula. The date is round-tripped through
+    date.fromisoformat so only a canonical YYYY-MM-DD literal can ever be
+    spliced into the formula.
+    """
+    ymd = date.fromisoformat(target_ymd).isoformat()
+    return f"IS_SAME({{{wx_date_field}}}, '{ymd}', 'day')"
+
+
 def airtable_find_wx_record(
     base_id: str,
     table: str,
     airtable_token: str,
     wx_date_field: str,
     target_ymd: str,
+    use_cache: bool = True,
 ) -> str:
     """
     Find exactly one WX record for the target date (day-level match).
     """
-    url = f"https://api.airtable.com/v0/{base_id}/{urllib.parse.quote(table)}"
+    id_cache = wx_id_cache_path(base_id, wx_table_id(table), wx_date_field, target_ymd)
+    if use_cache:
+        cached = read_cache(id_cache)
+        if cached and cached.get("id"):
+            return cached["id"]
+
     headers = {"Authorization": f"Bearer {airtable_token}"}
 
-    formula = f"IS_SAME({{{wx_date_field}}}, '{target_ymd}', 'day')"
-    params = {"filterByFormula": formula, "maxRecords": "2"}
-    url = f"{url}?{urllib.parse.urlencode(params)}"
+    params = {"filterByFormula": wx_date_formula(wx_date_field, target_ymd), "maxRecords": "2"}
+    url = f"{airtable_table_url(base_id, table)}?{urllib.parse.urlencode(params)}"
 
     resp = http_json("GET", url, headers)
     records = resp.get("records", [])
@@ -342,6 +512,8 @@ def airtable_find_wx_record(
         raise SystemExit(f"ERROR: No WX record found for {target_ymd} (table={table}, field={wx_date_field})")
     if len(records) > 1:
         raise SystemExit(f"ERROR: Multiple WX records matched {target_ymd}; expected 1")
+
+    write_cache(id_cache, {"id": records[0]["id"]})
     return records[0]["id"]
 
 
@@ -352,7 +524,7 @@ def airtable_patch_record(
     record_id: str,
     fields: Dict[str, Any],
 ) -> None:
-    url = f"https://api.airtable.com/v0/{base_id}/{urllib.parse.quote(table)}/{record_id}"
+    url = f"{airtable_table_url(base_id, table)}/{record_id}"
     headers = {
         "Authorization": f"Bearer {airtable_token}",
         "Content-Type": "application/json",
@@ -367,7 +539,7 @@ def airtable_patch_record(
 def main() -> None:
     print(
         "=== RUN START (UTC) ===",
-        datetime.now(ZoneInfo("UTC")).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
+        datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z"),
     )
     print("=== SCRIPT IDENTITY ===")
     print({"file": __file__, "mtime": os.path.getmtime(__file__)})
@@ -377,6 +549,11 @@ def main() -> None:
         "--date-local",
         help="Target local date (YYYY-MM-DD). Defaults to yesterday in local timezone.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached entity lists and WX record ids; look them up again.",
+    )
     args = parser.parse_args()
 
     tz = ZoneInfo(os.environ.get("TZ_NAME", TZ_NAME_DEFAULT))
@@ -389,14 +566,18 @@ def main() -> None:
     hum_entities = split_entities("HUM_ENTITIES")
     temp_entities = split_entities("TEMP_ENTITIES")
 
+    discover_only = os.environ.get("DISCOVER_ENTITIES") == "1"
+
     if not hum_entities or not temp_entities:
-        auto_hums, auto_temps = discover_entities(ha_base, ha_token)
+        auto_hums, auto_temps = discover_entities_cached(
+            ha_base, ha_token, use_cache=not (args.no_cache or discover_only)
+        )
         if not hum_entities:
             hum_entities = auto_hums
         if not temp_entities:
             temp_entities = auto_temps
 
-    if os.environ.get("DISCOVER_ENTITIES") == "1":
+    if discover_only:
         print("=== DISCOVERED TEMPERATURE ENTITIES ===")
         print("\n".join(temp_entities) if temp_entities else "(none)")
         print("=== DISCOVERED HUMIDITY ENTITIES ===")
@@ -435,16 +616,17 @@ def main() -> None:
     start_utc = to_utc_iso(start_local)
     end_utc = to_utc_iso(end_local)
 
-    # Query HA history
+    # Query HA history and reduce it to stats (per entity, concurrently);
+    # ha_url is the equivalent combined query, kept for the run report
     ha_url = ha_history_url(ha_base, start_utc, end_utc, all_entities)
     ha_headers = {
         "Authorization": f"Bearer {ha_token}",
         "Content-Type": "application/json",
     }
-    payload = http_json("GET", ha_url, ha_headers)
+    all_stats = fetch_ha_stats(ha_base, start_utc, end_utc, all_entities, ha_headers)
 
-    hum_stats = compute_stats(payload, hum_entities)
-    temp_stats = compute_stats(payload, temp_entities)
+    hum_stats = {eid: all_stats[eid] for eid in hum_entities}
+    temp_stats = {eid: all_stats[eid] for eid in temp_entities}
 
     min_samples = int(os.getenv("MIN_SAMPLES", "24"))
     warnings: List[str] = []
@@ -457,18 +639,19 @@ def main() -> None:
             print(w)
 
     # Find matching WX record and patch fields
-    wx_id = airtable_find_wx_record(airtable_base, airtable_table, airtable_token, wx_date_field, target_ymd)
+    wx_id = airtable_find_wx_record(
+        airtable_base, airtable_table, airtable_token, wx_date_field, target_ymd,
+        use_cache=not args.no_cache,
+    )
 
-    now_utc = datetime.now(ZoneInfo("UTC")).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+    now_utc = datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
     fields: Dict[str, Any] = {
-        AIRT_HUM_FIELD: json.dumps(
-            {"date_local": target_ymd, "generated_utc": now_utc, "entities": hum_stats},
-            separators=(",", ":"),
+        AIRT_HUM_FIELD: dumps_compact(
+            {"date_local": target_ymd, "generated_utc": now_utc, "entities": hum_stats}
         ),
-        AIRT_TEMP_FIELD: json.dumps(
-            {"date_local": target_ymd, "generated_utc": now_utc, "entities": temp_stats},
-            separators=(",", ":"),
+        AIRT_TEMP_FIELD: dumps_compact(
+            {"date_local": target_ymd, "generated_utc": now_utc, "entities": temp_stats}
         ),
         AIRT_HUMAN_FIELD: build_human_summary(
             target_ymd=target_ymd,
@@ -479,7 +662,7 @@ def main() -> None:
             temp_stats=temp_stats,
             warnings=warnings,
         ),
-        AIRT_SUMMARY_FIELD: json.dumps(
+        AIRT_SUMMARY_FIELD: dumps_compact(
             {
                 "date_local": target_ymd,
                 "generated_utc": now_utc,
@@ -488,15 +671,28 @@ def main() -> None:
                 "counts": {"humidity_entities": len(hum_entities), "temperature_entities": len(temp_entities)},
                 "min_samples": min_samples,
                 "warnings": warnings,
-            },
-            separators=(",", ":"),
+            }
         ),
         AIRT_LASTRUN_FIELD: now_utc,
     }
 
     write_wx = os.getenv("WRITE_WX", "1") == "1"
     if write_wx:
-        airtable_patch_record(airtable_base, airtable_table, airtable_token, wx_id, fields)
+        try:
+            airtable_patch_record(airtable_base, airtable_table, airtable_token, wx_id, fields)
+        except requests.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
+            if args.no_cache or status not in (404, 422):
+                raise
+            # The cached id may point at a deleted or merged WX record; drop it,
+            # look the date up again (duplicate check included) and retry once
+            print(f"WARNING: WX PATCH on cached id {wx_id} failed ({status}); looking it up again")
+            drop_cache(wx_id_cache_path(airtable_base, wx_table_id(airtable_table), wx_date_field, target_ymd))
+            wx_id = airtable_find_wx_record(
+                airtable_base, airtable_table, airtable_token, wx_date_field, target_ymd,
+                use_cache=False,
+            )
+            airtable_patch_record(airtable_base, airtable_table, airtable_token, wx_id, fields)
 
     print(
         json.dumps(
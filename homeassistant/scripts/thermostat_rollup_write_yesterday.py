@@ -4,9 +4,15 @@ import re
 import sys
 import json
 import time
+import hashlib
+import functools
 import requests
 import sqlite3
+import urllib.parse
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from zoneinfo import ZoneInfo
@@ -18,6 +24,8 @@ BASE_ID = "appoTbBi5JDuMvJ9D"
 TBL_EVENTS = "tblvd80WJDrMLCUfm"   # Thermostat Events
 TBL_WX     = "tblhUuES8IxQyoBqe"   # WX
 
+AIRTABLE_API = f"https://api.airtable.com/v0/{BASE_ID}"
+
 LOCAL_TZ = ZoneInfo("America/New_York")
 HA_DB_PATH = os.getenv("HA_DB_PATH", "/config/home-assistant_v2.db")
 
@@ -43,15 +51,28 @@ ZONE_DAILY_ENTITY = {
 
 ZONE_KWH_FIELD = {z: f"{z} KWH (Auto)" for z in ZONES_ORDER}
 TRACE_ID_LIMIT = 25
+AIRTABLE_BATCH_SIZE = 10  # Airtable's max records per multi-record PATCH
+
+# WX record ids per date are stable; cache lookups on disk for a day
+WX_ID_CACHE_DIR = os.path.expanduser(os.getenv("HA_ROLLUP_CACHE_DIR", "~/.cache/ha_rollup"))
+WX_ID_CACHE_TTL = 24 * 3600  # seconds
+
+_BEARER_RE = re.compile(r'Authorization:\s*"Bearer\s+([^\"]+)"')
 
+
+@functools.cache
 def read_token_from_config_yaml(path=None):
     path = path or os.getenv("HA_CONFIG_PATH", "/config/configuration.yaml")
 
     try:
         with open(path, "r", encoding="utf-8") as f:
-            text = f.read()
-        m = re.search(r'Authorization:\s*"Bearer\s+([^\"]+)"', text)
-        return m.group(1).strip() if m else None
+            for line in f:
+                if "Authorization" not in line:
+                    continue
+                m = _BEARER_RE.search(line)
+                if m:
+                    return m.group(1).strip()
+        return None
     except Exception:
         return None
 
@@ -74,19 +95,31 @@ def airtable_headers(token):
     }
 
 
+def build_airtable_session():
+    """
+    Keep-alive session for every Airtable call in the run. Connection
+    errors and 429/5xx responses are retried with exponential backoff
+    (1,2,4,8,16s), honoring Retry-After; other 4xx fail immediately.
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=1,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "PATCH"]),
+        respect_retry_after_header=True,
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+
+_SESSION = build_airtable_session()
+
+
 def airtable_request(method, url, headers, **kwargs):
-    last_exc = None
-    for attempt in range(5):
-        try:
-            r = requests.request(method, url, headers=headers, timeout=30, **kwargs)
-            r.raise_for_status()
-            return r
-        except requests.RequestException as e:
-            last_exc = e
-            sleep = 2 ** attempt  # 1,2,4,8,16
-            print(f"WARNING: Airtable request failed (attempt {attempt+1}/5). Retrying in {sleep}s. Error: {e}")
-            time.sleep(sleep)
-    raise last_exc
+    r = _SESSION.request(method, url, headers=headers, timeout=30, **kwargs)
+    r.raise_for_status()
+    return r
 
 
 def iso_local_midnight_range_for_yesterday():
@@ -132,7 +165,7 @@ def classify_event(new_sp, prev_sp):
 
 
 def fetch_events(token, start_local, end_local):
-    url = f"https://api.airtable.com/v0/{BASE_ID}/{TBL_EVENTS}"
+    url = f"{AIRTABLE_API}/{TBL_EVENTS}"
     formula = (
         "AND("
         f"{{Timestamp}} >= DATETIME_PARSE('{dt_iso(start_local)}'),"
@@ -157,9 +190,57 @@ def fetch_events(token, start_local, end_local):
     return records
 
 
-def find_wx_record_for_date(token, target_date_iso):
-    url = f"https://api.airtable.com/v0/{BASE_ID}/{TBL_WX}"
-    formula = f"IS_SAME({{datetime}}, '{target_date_iso}', 'day')"
+def wx_id_cache_path(base_id, table_id, date_field, target_ymd):
+    """
+    Cache file for a WX record id. Mirrors the indoor-env rollup's
+    wx_id_cache_path (keyed on the table id) so both scripts share entries.
+    """
+    key = f"{base_id}|{table_id}|{date_field}|{target_ymd}"
+    return os.path.join(WX_ID_CACHE_DIR, f"wx_id_{hashlib.sha1(key.encode()).hexdigest()[:16]}.json")
+
+
+def read_cached_wx_id(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        if time.time() - entry["ts"] < WX_ID_CACHE_TTL:
+            return entry["id"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def write_cached_wx_id(path, record_id):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"id": record_id, "ts": time.time()}, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"WARNING: could not cache WX record id: {e}")
+
+
+def drop_cached_wx_id(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print(f"WARNING: could not drop cached WX record id: {e}")
+
+
+def find_wx_record_for_date(token, target_date_iso, use_cache=True):
+    cache_path = wx_id_cache_path(BASE_ID, TBL_WX, "datetime", target_date_iso)
+    if use_cache:
+        cached = read_cached_wx_id(cache_path)
+        if cached:
+            return cached
+
+    # Re-validate the date so only a canonical YYYY-MM-DD reaches the formula
+    ymd = datetime.strptime(target_date_iso, "%Y-%m-%d").date().isoformat()
+    url = f"{AIRTABLE_API}/{TBL_WX}"
+    formula = f"IS_SAME({{datetime}}, '{ymd}', 'day')"
 
     r = airtable_request(
         "GET",
@@ -176,40 +257,33 @@ def find_wx_record_for_date(token, target_date_iso):
         ids = [rr["id"] for rr in recs]
         raise RuntimeError(f"Multiple WX records found for {target_date_iso}: {ids}")
 
+    write_cached_wx_id(cache_path, recs[0]["id"])
     return recs[0]["id"]
 
 
 def build_summary(target_date_iso, events):
-    totals = {"SETPOINT_CHANGE": 0, "TURNED_OFF": 0, "TURNED_ON_RESTORE": 0, "UNKNOWN": 0}
-    per_zone = {
-        z: {"SETPOINT_CHANGE": 0, "TURNED_OFF": 0, "TURNED_ON_RESTORE": 0, "UNKNOWN": 0, "ids": []}
-        for z in ZONES_ORDER
-    }
+    totals = Counter()
+    # Known zones first, in display order; unknown zones follow as first seen
+    per_zone = defaultdict(Counter, {z: Counter() for z in ZONES_ORDER})
+    ids_by_zone = defaultdict(list)
     zones_active = set()
 
-    normalized = []
     for rec in events:
         rid = rec.get("id")
         f = rec.get("fields", {})
         zone = f.get("Thermostat")
-        ts = f.get("Timestamp")
         new_sp = f.get("New Setpoint")
         prev_sp = f.get("Previous Setpoint")
 
         etype = classify_event(new_sp, prev_sp)
-        normalized.append((ts, zone, etype, rid))
 
-        totals[etype] = totals.get(etype, 0) + 1
+        totals[etype] += 1
 
         if zone:
             zones_active.add(zone)
-            if zone not in per_zone:
-                per_zone[zone] = {"SETPOINT_CHANGE": 0, "TURNED_OFF": 0, "TURNED_ON_RESTORE": 0, "UNKNOWN": 0, "ids": []}
-            per_zone[zone][etype] = per_zone[zone].get(etype, 0) + 1
+            per_zone[zone][etype] += 1
             if rid:
-                per_zone[zone]["ids"].append(rid)
-
-    normalized.sort(key=lambda x: (x[0] or "", x[1] or "", x[2] or ""))
+                ids_by_zone[zone].append(rid)
 
     ordered_active = [z for z in ZONES_ORDER if z in zones_active]
     for z in sorted(zones_active):
@@ -223,28 +297,26 @@ def build_summary(target_date_iso, events):
     lines.append(f"Zones active: {', '.join(ordered_active) if ordered_active else '(none)'}")
     lines.append("")
     lines.append("Event breakdown:")
-    lines.append(f"- Setpoint changes: {totals.get('SETPOINT_CHANGE', 0)}")
-    lines.append(f"- Turned OFF (New=0): {totals.get('TURNED_OFF', 0)}")
-    lines.append(f"- Turned ON restore (Prev=0): {totals.get('TURNED_ON_RESTORE', 0)}")
-    if totals.get("UNKNOWN", 0):
-        lines.append(f"- Unknown: {totals.get('UNKNOWN', 0)}")
+    lines.append(f"- Setpoint changes: {totals['SETPOINT_CHANGE']}")
+    lines.append(f"- Turned OFF (New=0): {totals['TURNED_OFF']}")
+    lines.append(f"- Turned ON restore (Prev=0): {totals['TURNED_ON_RESTORE']}")
+    if totals["UNKNOWN"]:
+        lines.append(f"- Unknown: {totals['UNKNOWN']}")
 
     lines.append("")
     lines.append("Per-zone rollup (counts):")
-    for z in list(per_zone.keys()):
-        d = per_zone[z]
-        c_sum = d.get("SETPOINT_CHANGE", 0) + d.get("TURNED_OFF", 0) + d.get("TURNED_ON_RESTORE", 0) + d.get("UNKNOWN", 0)
-        if c_sum == 0:
+    for z, d in per_zone.items():
+        if not d:
             continue
 
         lines.append(
-            f"- {z}: setpoint={d.get('SETPOINT_CHANGE', 0)}, "
-            f"off={d.get('TURNED_OFF', 0)}, "
-            f"on_restore={d.get('TURNED_ON_RESTORE', 0)}"
-            + (f", unknown={d.get('UNKNOWN', 0)}" if d.get("UNKNOWN", 0) else "")
+            f"- {z}: setpoint={d['SETPOINT_CHANGE']}, "
+            f"off={d['TURNED_OFF']}, "
+            f"on_restore={d['TURNED_ON_RESTORE']}"
+            + (f", unknown={d['UNKNOWN']}" if d["UNKNOWN"] else "")
         )
 
-        ids = d.get("ids", [])
+        ids = ids_by_zone.get(z, [])
         if ids:
             show = ids[:TRACE_ID_LIMIT]
             more = len(ids) - len(show)
@@ -254,58 +326,109 @@ def build_summary(target_date_iso, events):
     return "\n".join(lines)
 
 
-def _local_to_utc_ts(dt_local: datetime) -> float:
-    return dt_local.astimezone(ZoneInfo("UTC")).timestamp()
+_DB_CON = None
 
 
-def read_yesterday_daily_kwh_from_db(start_local: datetime, end_local: datetime):
-    if not os.path.exists(HA_DB_PATH):
-        raise FileNotFoundError(f"HA DB not found at {HA_DB_PATH}")
+def ha_db_connection():
+    """
+    Read-only connection to the HA recorder DB, opened once per run.
+
+    mode=ro + query_only keep this process from ever taking write locks on
+    the live recorder's database; mmap makes repeated index reads cheap.
+    """
+    global _DB_CON
+    if _DB_CON is None:
+        if not os.path.exists(HA_DB_PATH):
+            raise FileNotFoundError(f"HA DB not found at {HA_DB_PATH}")
+        con = sqlite3.connect(f"file:{urllib.parse.quote(HA_DB_PATH)}?mode=ro", uri=True)
+        con.row_factory = sqlite3.Row
+        con.execute("PRAGMA query_only = 1")
+        con.execute("PRAGMA temp_store = MEMORY")
+        con.execute("PRAGMA mmap_size = 268435456")
+        _DB_CON = con
+    return _DB_CON
+
 
-    start_utc_ts = _local_to_utc_ts(start_local)
-    end_utc_ts = _local_to_utc_ts(end_local)
+def read_yesterday_daily_kwh_from_db(start_local: datetime, end_local: datetime):
+    # Aware datetimes carry their offset; timestamp() is already UTC epoch.
+    # end_local comes from a wall-clock +1 day, so 23/25h DST days stay right.
+    start_utc_ts = start_local.timestamp()
+    end_utc_ts = end_local.timestamp()
 
-    con = sqlite3.connect(HA_DB_PATH)
-    con.row_factory = sqlite3.Row
-    cur = con.cursor()
+    cur = ha_db_connection().cursor()
 
-    cur.execute("SELECT metadata_id, entity_id FROM states_meta")
+    entities = list(ZONE_DAILY_ENTITY.values())
+    cur.execute(
+        f"SELECT metadata_id, entity_id FROM states_meta WHERE entity_id IN ({','.join('?' * len(entities))})",
+        entities,
+    )
     meta = {row["entity_id"]: row["metadata_id"] for row in cur.fetchall()}
 
-    out = {}
-    for zone, ent in ZONE_DAILY_ENTITY.items():
+    # Latest usable state per daily-energy sensor within the window, all in one query
+    latest = {}
+    mids = list(meta.values())
+    if mids:
         try:
-            mid = meta.get(ent)
-            if not mid:
-                out[zone] = None
-                continue
-
             cur.execute(
-                """
-                SELECT state, last_updated_ts
-                FROM states
-                WHERE metadata_id = ?
-                  AND last_updated_ts >= ?
-                  AND last_updated_ts <  ?
-                  AND state NOT IN ('unknown','unavailable')
-                ORDER BY last_updated_ts DESC
-                LIMIT 1
+                f"""
+                SELECT metadata_id, state
+                FROM (
+                    SELECT metadata_id, state,
+                           ROW_NUMBER() OVER (
+                               PARTITION BY metadata_id ORDER BY last_updated_ts DESC
+                           ) AS rn
+                    FROM states
+                    WHERE metadata_id IN ({','.join('?' * len(mids))})
+                      AND last_updated_ts >= ?
+                      AND last_updated_ts <  ?
+                      AND state NOT IN ('unknown','unavailable')
+                )
+                WHERE rn = 1
                 """,
-                (mid, start_utc_ts, end_utc_ts),
+                (*mids, start_utc_ts, end_utc_ts),
             )
-            row = cur.fetchone()
-            out[zone] = round(float(row["state"]), 3) if row else None
+            latest = {row["metadata_id"]: row["state"] for row in cur.fetchall()}
+        except Exception as e:
+            print(f"ERROR: kWh read failed: {e}")
+
+    out = {}
+    for zone, ent in ZONE_DAILY_ENTITY.items():
+        state = latest.get(meta.get(ent))
+        try:
+            out[zone] = round(float(state), 3) if state is not None else None
         except Exception as e:
             print(f"ERROR: kWh read failed for {zone}: {e}")
             out[zone] = None
 
-    con.close()
+    cur.close()
     return out
 
 
-def update_wx_record(token, wx_record_id, summary_text, kwh_by_zone, write_wx: bool):
-    url = f"https://api.airtable.com/v0/{BASE_ID}/{TBL_WX}/{wx_record_id}"
+def airtable_patch_batch(token, table, updates):
+    """
+    PATCH (record_id, fields) pairs through the table endpoint,
+    AIRTABLE_BATCH_SIZE records per request. Returns the updated records.
+    """
+    url = f"{AIRTABLE_API}/{table}"
+    updated = []
+    for i in range(0, len(updates), AIRTABLE_BATCH_SIZE):
+        payload = {
+            "records": [
+                {"id": rid, "fields": fields}
+                for rid, fields in updates[i:i + AIRTABLE_BATCH_SIZE]
+            ],
+            "typecast": False,
+        }
+        r = airtable_request("PATCH", url, airtable_headers(token), data=json.dumps(payload))
+        updated.extend(r.json().get("records", []))
+    return updated
 
+
+def update_wx_record(token, wx_record_id, summary_text, kwh_by_zone, write_wx: bool, pending=None):
+    """
+    Write the rollup fields to one WX record. If `pending` is a list, the
+    update is appended to it instead, for a later airtable_patch_batch.
+    """
     fields = {
         "Thermostat Settings (Auto)": summary_text,
         "Data Source": "Auto",
@@ -323,8 +446,56 @@ def update_wx_record(token, wx_record_id, summary_text, kwh_by_zone, write_wx: b
         print(json.dumps(payload, indent=2))
         return {"dry_run": True}
 
-    r = airtable_request("PATCH", url, airtable_headers(token), data=json.dumps(payload))
-    return r.json()
+    if pending is not None:
+        pending.append((wx_record_id, fields))
+        return {"queued": True}
+
+    return airtable_patch_batch(token, TBL_WX, [(wx_record_id, fields)])[0]
+
+
+def flush_wx_updates(token, pending, pending_days, use_cache=True):
+    """
+    PATCH the queued WX updates and clear the queue. `pending_days` holds
+    the target date of each queued update, for progress output and for
+    re-resolving cached record ids that Airtable rejects.
+    """
+    if not pending:
+        return
+    # Take the batch off the queue first, so a failed write is reported once
+    # rather than retried by a later flush
+    batch, days = list(pending), list(pending_days)
+    pending.clear()
+    pending_days.clear()
+
+    failed = []
+    try:
+        updated = airtable_patch_batch(token, TBL_WX, batch)
+    except requests.HTTPError as e:
+        status = e.response.status_code if e.response is not None else None
+        if not use_cache or status not in (404, 422):
+            raise
+        # A cached id may point at a deleted or merged WX record. Drop the
+        # cached ids, look the days up again (duplicate check included) and
+        # retry once; days that still can't be resolved are reported below.
+        print(f"WARNING: WX PATCH failed ({status}); re-resolving cached WX record ids")
+        resolved, resolved_days = [], []
+        for day, (_, fields) in zip(days, batch):
+            drop_cached_wx_id(wx_id_cache_path(BASE_ID, TBL_WX, "datetime", day))
+            try:
+                resolved.append((find_wx_record_for_date(token, day, use_cache=False), fields))
+                resolved_days.append(day)
+            except Exception as lookup_err:
+                print(f"ERROR: WX lookup failed for {day}: {lookup_err}")
+                failed.append(day)
+        batch, days = resolved, resolved_days
+        updated = airtable_patch_batch(token, TBL_WX, batch) if batch else []
+
+    for day in days:
+        print(f"wx_update: OK {day}")
+    n_requests = -(-len(batch) // AIRTABLE_BATCH_SIZE)
+    print(f"wx_batch: {len(updated)} records in {n_requests} request(s)")
+    if failed:
+        raise RuntimeError(f"WX update not written for: {', '.join(failed)}")
 
 def iter_past_days_local(n_days: int):
     now_local = datetime.now(LOCAL_TZ)
@@ -369,6 +540,9 @@ def main() -> int:
             return 2
         date_local = argv[i + 1].strip()
 
+    # Force fresh WX record lookups instead of the on-disk id cache
+    use_cache = "--no-cache" not in argv
+
     if days_back is not None and date_local:
         print("ERROR: Use either --days-back or --date-local, not both.")
         return 2
@@ -387,57 +561,70 @@ def main() -> int:
     else:
         print("window: single day")
 
-    # Process each date
-    for d in dates:
-        if d:
-            target_date_iso, start_local, end_local = iso_local_midnight_range_for_date(d)
-        else:
-            target_date_iso, start_local, end_local = iso_local_midnight_range_for_yesterday()
-
-        print(f"\n=== day {target_date_iso} ===")
+    # WX updates are queued and written a full batch at a time
+    pending_wx = []
+    pending_days = []
 
-        events = fetch_events(token, start_local, end_local)
-        print(f"events_fetched: {len(events)}")
-
-        try:
-            wx_record_id = find_wx_record_for_date(token, target_date_iso)
-        except Exception as e:
-            print(f"ERROR: WX lookup failed for {target_date_iso}: {e}")
-            continue
-
-        print(f"wx_record_id: {wx_record_id}")
-
-        summary_text = build_summary(target_date_iso, events)
+    # Process each date; whatever is still queued is written even if a
+    # later day fails
+    try:
+        for d in dates:
+            if d:
+                target_date_iso, start_local, end_local = iso_local_midnight_range_for_date(d)
+            else:
+                target_date_iso, start_local, end_local = iso_local_midnight_range_for_yesterday()
 
-        kwh_by_zone = read_yesterday_daily_kwh_from_db(start_local, end_local)
-        missing = [z for z, v in kwh_by_zone.items() if v is None]
+            print(f"\n=== day {target_date_iso} ===")
 
-        print("kwh_by_zone:")
-        for z in ZONES_ORDER:
-            print(f"- {z}: {kwh_by_zone.get(z)}")
+            events = fetch_events(token, start_local, end_local)
+            print(f"events_fetched: {len(events)}")
 
-        if missing:
-            print(f"WARNING: missing kWh for zones: {', '.join(missing)}")
-            summary_text += (
-                "\n\nkWh note: One or more zones have no kWh for this date. "
-                "This is expected if energy meters were added after the target date, "
-                "or if recorder history is missing for the daily energy sensors."
-            )
+            try:
+                wx_record_id = find_wx_record_for_date(token, target_date_iso, use_cache)
+            except Exception as e:
+                print(f"ERROR: WX lookup failed for {target_date_iso}: {e}")
+                continue
 
-        _ = update_wx_record(token, wx_record_id, summary_text, kwh_by_zone, write_wx)
-        print("wx_update: OK" if write_wx else "wx_update: SKIPPED (dry run)")
-
-        run_summary = {
-            "rollup": "thermostat",
-            "date": target_date_iso,
-            "events_fetched": len(events),
-            "kwh_present": sum(1 for v in kwh_by_zone.values() if v is not None),
-            "kwh_missing": sum(1 for v in kwh_by_zone.values() if v is None),
-            "wx_record_id": wx_record_id,
-            "write_mode": bool(write_wx),
-        }
-        print("run_summary_json:")
-        print(json.dumps(run_summary, indent=2))
+            print(f"wx_record_id: {wx_record_id}")
+
+            summary_text = build_summary(target_date_iso, events)
+
+            kwh_by_zone = read_yesterday_daily_kwh_from_db(start_local, end_local)
+            missing = [z for z, v in kwh_by_zone.items() if v is None]
+
+            print("kwh_by_zone:")
+            for z in ZONES_ORDER:
+                print(f"- {z}: {kwh_by_zone.get(z)}")
+
+            if missing:
+                print(f"WARNING: missing kWh for zones: {', '.join(missing)}")
+                summary_text += (
+                    "\n\nkWh note: One or more zones have no kWh for this date. "
+                    "This is expected if energy meters were added after the target date, "
+                    "or if recorder history is missing for the daily energy sensors."
+                )
+
+            _ = update_wx_record(token, wx_record_id, summary_text, kwh_by_zone, write_wx, pending_wx)
+            print("wx_update: QUEUED" if write_wx else "wx_update: SKIPPED (dry run)")
+            if write_wx:
+                pending_days.append(target_date_iso)
+
+            run_summary = {
+                "rollup": "thermostat",
+                "date": target_date_iso,
+                "events_fetched": len(events),
+                "kwh_present": sum(1 for v in kwh_by_zone.values() if v is not None),
+                "kwh_missing": sum(1 for v in kwh_by_zone.values() if v is None),
+                "wx_record_id": wx_record_id,
+                "write_mode": bool(write_wx),
+            }
+            print("run_summary_json:")
+            print(json.dumps(run_summary, indent=2))
+
+            if len(pending_wx) >= AIRTABLE_BATCH_SIZE:
+                flush_wx_updates(token, pending_wx, pending_days, use_cache)
+    finally:
+        flush_wx_updates(token, pending_wx, pending_days, use_cache)
 
     return 0
 
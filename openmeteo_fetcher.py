@@ -10,35 +10,164 @@ CHANGELOG
 """
 
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import date, datetime, timedelta
 import logging
 import os
-from typing import Dict, List
+from typing import Dict, List, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import time
+import bisect
 import json
-from dotenv import load_dotenv
+import math
+import re
+import statistics
+import threading
+from urllib.parse import urlencode
+from zoneinfo import ZoneInfo
+
+try:
+    import orjson  # optional: faster decode of the hourly float arrays
+except ImportError:
+    orjson = None
+
+# Configure logging to match existing system; callers own handlers/formatting
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
-load_dotenv()
+# Forecast responses keyed by (lat, lon, start_date, end_date, forecast_days) -> (expiry, payload).
+# Open-Meteo refreshes hourly at most, so repeat calls within a run are served
+# from memory; a Cache-Control max-age on the response overrides the default TTL.
+RESPONSE_CACHE_TTL = 900  # seconds
+_response_cache: Dict[tuple, Tuple[float, Dict]] = {}
+_response_cache_lock = threading.Lock()
+_MAX_AGE_RE = re.compile(r'max-age=(\d+)')
+
+# Open-Meteo returns hourly/daily times as wall-clock strings in this zone, so
+# "today" and "now" must be taken here too, not from the host's local clock
+FORECAST_TZ = 'America/New_York'
+_TZ = ZoneInfo(FORECAST_TZ)
+
+# Keep-alive connections per host; also the default fetch_many concurrency
+HTTP_POOL_SIZE = 8
+
+# Guards against pathological requests/responses
+MAX_RESPONSE_BYTES = 10_000_000
+MAX_WINDOW_DAYS = 30
+
+# Airtable field typing applied in prepare_records
+_FIELDS_ROUND1 = frozenset({'om_temp', 'om_temp_f', 'om_humidity', 'om_pressure',
+                            'om_wind_speed', 'om_wind_speed_mph', 'om_snow_depth'})
+_FIELDS_INT = frozenset({'om_weather_code', 'om_elevation'})
+_FIELDS_ROUND2 = frozenset({'om_precipitation', 'om_snowfall', 'om_snowfall_6h'})
+
+
+def clear_cache():
+    """Drop all cached Open-Meteo responses."""
+    with _response_cache_lock:
+        _response_cache.clear()
+
+
+def _pad_to(values: List, n: int) -> List:
+    """values, extended with None if shorter than n."""
+    return values if len(values) >= n else list(values) + [None] * (n - len(values))
+
+
+def _response_ttl(response) -> float:
+    m = _MAX_AGE_RE.search(response.headers.get('Cache-Control', ''))
+    return float(m.group(1)) if m else RESPONSE_CACHE_TTL
 
-# Configure logging to match existing system
-logger = logging.getLogger(__name__)
 
 class OpenMeteoFetcher:
-    def __init__(self):
+    __slots__ = ('base_url', 'lat', 'lon', 'elevation', 'forecast_days', '_default_url', '_session')
+
+    # Request-invariant forecast query; per-call code adds coordinates, dates
+    # and the instance's forecast_days
+    _BASE_PARAMS = {
+        'hourly': (
+            'temperature_2m,relative_humidity_2m,precipitation,'
+            'snowfall,snow_depth,weather_code,surface_pressure,wind_speed_10m'
+        ),
+        'daily': (
+            'temperature_2m_max,temperature_2m_min,temperature_2m_mean,'
+            'precipitation_sum,snowfall_sum,weather_code,wind_speed_10m_max'
+        ),
+        'timezone': FORECAST_TZ,
+    }
+
+    def __init__(self, latitude: float = 42.28, longitude: float = -74.21,
+                 elevation: int = 549, forecast_days: int = 16):
+        """
+        forecast_days is per instance, not fixed: it goes into every forecast
+        request, the pre-encoded default URL and the response cache key.
+        """
         self.base_url = "https://api.open-meteo.com/v1/forecast"
-        # Hensonville, NY coordinates
-        self.lat = 42.28
-        self.lon = -74.21
-        self.elevation = 549  # meters (1,801 ft) - closer to actual 1,972ft than airports
-        logger.info("Initialized OpenMeteoFetcher for Hensonville, NY",
+        # Defaults are Hensonville, NY
+        self.lat = latitude
+        self.lon = longitude
+        self.elevation = elevation  # meters; 549 (1,801 ft) is closer to actual 1,972ft than airports
+        self.forecast_days = forecast_days
+        # The default-location, no-date query never changes; encode it once
+        self._default_url = f"{self.base_url}?{urlencode(self._forecast_params(self.lat, self.lon))}"
+        # Keep-alive session so repeat calls skip the TCP/TLS handshake
+        self._session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504])
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE,
+                                                    max_retries=retry))
+        logger.info("Initialized OpenMeteoFetcher for %s, %s", self.lat, self.lon,
                    extra={'context': 'OpenMeteo Initialization'})
 
+    def close(self):
+        """Release pooled HTTP connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
     def fetch_weather_data(self, latitude: float = None, longitude: float = None,
                            start_time: datetime = None, end_time: datetime = None) -> Dict:
         """Backwards-compatible alias used by update_openmeteo.py."""
         return self.get_weather_data(latitude=latitude, longitude=longitude,
                                      start_time=start_time, end_time=end_time)
 
+    def _forecast_params(self, lat, lon, start_time: datetime = None, end_time: datetime = None) -> Dict:
+        """
+        Query parameters for the forecast endpoint; lat/lon may be comma-joined lists
+        """
+        params = {'latitude': lat, 'longitude': lon, **self._BASE_PARAMS,
+                  'forecast_days': self.forecast_days}
+
+        if start_time is not None:
+            params['start_date'] = start_time.isoformat()[:10]
+        if end_time is not None:
+            params['end_date'] = end_time.isoformat()[:10]
+        if 'start_date' in params and 'end_date' in params:
+            span = (date.fromisoformat(params['end_date']) - date.fromisoformat(params['start_date'])).days
+            if not 0 <= span <= MAX_WINDOW_DAYS:
+                raise ValueError(f"Open-Meteo window {params['start_date']}..{params['end_date']} "
+                                 f"must span 0-{MAX_WINDOW_DAYS} days")
+        return params
+
+    def _get_json(self, params: Dict = None, url: str = None):
+        """
+        GET the forecast endpoint (or a pre-encoded url) and decode the body,
+        refusing bodies over MAX_RESPONSE_BYTES. Returns (data, response).
+        """
+        with self._session.get(url or self.base_url, params=params, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            buf = bytearray()
+            for chunk in response.iter_content(65536):
+                buf.extend(chunk)
+                if len(buf) > MAX_RESPONSE_BYTES:
+                    raise ValueError(f"Open-Meteo response exceeded {MAX_RESPONSE_BYTES} bytes")
+        data = orjson.loads(buf) if orjson else json.loads(buf)
+        return data, response
+
     def get_weather_data(self, latitude: float = None, longitude: float = None,
                          start_time: datetime = None, end_time: datetime = None) -> Dict:
         """
@@ -47,43 +176,92 @@ class OpenMeteoFetcher:
         lat = latitude if latitude is not None else self.lat
         lon = longitude if longitude is not None else self.lon
 
-        params = {
-            'latitude': lat,
-            'longitude': lon,
-            'hourly': (
-                'temperature_2m,relative_humidity_2m,precipitation,'
-                'snowfall,snow_depth,weather_code,surface_pressure,wind_speed_10m'
-            ),
-            'daily': (
-                'temperature_2m_max,temperature_2m_min,temperature_2m_mean,'
-                'precipitation_sum,snowfall_sum,weather_code,wind_speed_10m_max'
-            ),
-            'timezone': 'America/New_York',
-            'forecast_days': 16
-        }
-
-        if start_time is not None:
-            params['start_date'] = start_time.strftime('%Y-%m-%d')
-        if end_time is not None:
-            params['end_date'] = end_time.strftime('%Y-%m-%d')
+        if lat == self.lat and lon == self.lon and start_time is None and end_time is None:
+            url, params = self._default_url, None
+        else:
+            url, params = None, self._forecast_params(lat, lon, start_time, end_time)
+
+        dates = params or {}
+        cache_key = (round(lat, 3), round(lon, 3),
+                     dates.get('start_date'), dates.get('end_date'), self.forecast_days)
+        with _response_cache_lock:
+            cached = _response_cache.get(cache_key)
+        if cached is not None and time.monotonic() < cached[0]:
+            logger.info("Using cached Open-Meteo data for coordinates: %s, %s", lat, lon,
+                       extra={'context': 'OpenMeteo Data Retrieval'})
+            return cached[1]
 
         try:
-            logger.info(f"Fetching Open-Meteo data for coordinates: {lat}, {lon}",
+            logger.info("Fetching Open-Meteo data for coordinates: %s, %s", lat, lon,
                        extra={'context': 'OpenMeteo Data Retrieval'})
 
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            data, response = self._get_json(params, url)
+
+            with _response_cache_lock:
+                _response_cache[cache_key] = (time.monotonic() + _response_ttl(response), data)
 
             logger.info("Successfully retrieved Open-Meteo forecast data",
                        extra={'context': 'OpenMeteo Data Retrieved'})
             return data
 
         except requests.RequestException as e:
-            logger.error(f"Error fetching Open-Meteo data: {e}",
+            logger.error("Error fetching Open-Meteo data: %s", e,
+                        extra={'context': 'OpenMeteo API Error'})
+            raise
+
+    def get_weather_data_batch(self, coords: Sequence[Tuple[float, float]],
+                               start_time: datetime = None, end_time: datetime = None) -> List[Dict]:
+        """
+        Fetch forecast data for several (lat, lon) pairs in a single request.
+        Open-Meteo accepts comma-separated coordinate lists and answers with one
+        payload per location, in the same order as coords.
+        """
+        if not coords:
+            return []
+        if len(coords) == 1:
+            lat, lon = coords[0]
+            return [self.get_weather_data(latitude=lat, longitude=lon,
+                                          start_time=start_time, end_time=end_time)]
+
+        params = self._forecast_params(
+            ','.join(f'{la:.4f}' for la, _ in coords),
+            ','.join(f'{lo:.4f}' for _, lo in coords),
+            start_time, end_time,
+        )
+
+        try:
+            logger.info("Fetching Open-Meteo data for %s locations in one request", len(coords),
+                       extra={'context': 'OpenMeteo Data Retrieval'})
+
+            data, _ = self._get_json(params)
+
+            # A list comes back for multiple coordinates; be lenient about a bare dict
+            results = data if isinstance(data, list) else [data]
+            logger.info("Successfully retrieved Open-Meteo forecast data for %s locations", len(results),
+                       extra={'context': 'OpenMeteo Data Retrieved'})
+            return results
+
+        except requests.RequestException as e:
+            logger.error("Error fetching batched Open-Meteo data: %s", e,
                         extra={'context': 'OpenMeteo API Error'})
             raise
 
+    def fetch_many(self, coords: Sequence[Tuple[float, float]],
+                   start_time: datetime = None, end_time: datetime = None,
+                   max_workers: int = HTTP_POOL_SIZE) -> List[Dict]:
+        """
+        Fetch forecast data for several (lat, lon) pairs concurrently.
+        Results are returned in the same order as coords; any failure raises.
+        Workers beyond HTTP_POOL_SIZE would open throwaway connections.
+        """
+        if not coords:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(coords)))) as pool:
+            return list(pool.map(
+                lambda c: self.get_weather_data(latitude=c[0], longitude=c[1],
+                                                start_time=start_time, end_time=end_time),
+                coords))
+
     def prepare_records(self, data: Dict) -> List[Dict]:
         """
         Prepare records for Airtable update from Open-Meteo data
@@ -91,57 +269,68 @@ class OpenMeteoFetcher:
         try:
             records: List[Dict] = []
 
-            daily_data = data.get('daily', {})
-            hourly_data = data.get('hourly', {})
-            daily_times = daily_data.get('time', [])
-            hourly_times = hourly_data.get('time', [])
+            daily_data = data.get('daily') or {}
+            hourly_data = data.get('hourly') or {}
+            daily_times = daily_data.get('time') or []
+            hourly_times = hourly_data.get('time') or []
 
             if not daily_times:
                 logger.warning("No daily data available from Open-Meteo",
                              extra={'context': 'OpenMeteo Data Preparation'})
                 return records
 
-            today_str = datetime.now().strftime('%Y-%m-%d')
-
-            temps_c = daily_data.get('temperature_2m_mean', [])
-            precip_sums = daily_data.get('precipitation_sum', [])
-            snowfall_sums = daily_data.get('snowfall_sum', [])
-            weather_codes = daily_data.get('weather_code', [])
-            wind_max = daily_data.get('wind_speed_10m_max', [])
+            now_tz = datetime.now(_TZ)
+            now = now_tz.replace(tzinfo=None)  # naive wall clock, comparable with hourly times
+            today_str = now.date().isoformat()
+            data_timestamp = now_tz.isoformat()
+
+            temps_c = daily_data.get('temperature_2m_mean') or []
+            precip_sums = daily_data.get('precipitation_sum') or []
+            snowfall_sums = daily_data.get('snowfall_sum') or []
+            weather_codes = daily_data.get('weather_code') or []
+            wind_max = daily_data.get('wind_speed_10m_max') or []
+
+            # Open-Meteo sizes every daily array to daily.time; pad once so a short
+            # array can't go out of range and the loop indexes without bounds checks
+            n_days = len(daily_times)
+            temps_c, precip_sums, snowfall_sums, weather_codes, wind_max = (
+                _pad_to(a, n_days)
+                for a in (temps_c, precip_sums, snowfall_sums, weather_codes, wind_max)
+            )
+
+            # One pass over hourly_times: date -> [start, end) index range
+            day_ranges = self._hourly_day_ranges(hourly_times)
+            humidity_data = hourly_data.get('relative_humidity_2m') or []
+            pressure_data = hourly_data.get('surface_pressure') or []
+            snow_depth_data = hourly_data.get('snow_depth') or []
+            snowfall_data = hourly_data.get('snowfall') or []
 
             for i, date_str in enumerate(daily_times):
                 # Temperature from daily data
-                temp_c = temps_c[i] if i < len(temps_c) else None
+                temp_c = temps_c[i]
                 temp_f = (temp_c * 9/5) + 32 if temp_c is not None else None
 
-                daily_precip = precip_sums[i] if i < len(precip_sums) else None
-                daily_code = weather_codes[i] if i < len(weather_codes) else None
-                daily_wind = wind_max[i] if i < len(wind_max) else None
-
-                # Daily averages from hourly data
-                daily_humidity = self._calculate_daily_average(
-                    hourly_data, 'relative_humidity_2m', hourly_times, date_str
-                )
-                daily_pressure = self._calculate_daily_average(
-                    hourly_data, 'surface_pressure', hourly_times, date_str
-                )
-
-                # Snow fields
-                daily_snow_depth = self._calculate_daily_average(
-                    hourly_data, 'snow_depth', hourly_times, date_str
-                )
-
-                daily_snowfall = self._calculate_daily_sum(
-                    hourly_data, 'snowfall', hourly_times, date_str
-                )
+                daily_precip = precip_sums[i]
+                daily_code = weather_codes[i]
+                daily_wind = wind_max[i]
+
+                # Daily aggregates from hourly data
+                day_range = day_ranges.get(date_str)
+                if day_range is not None:
+                    start, end = day_range
+                    daily_humidity = self._calculate_daily_average(humidity_data, start, end)
+                    daily_pressure = self._calculate_daily_average(pressure_data, start, end)
+                    daily_snow_depth = self._calculate_daily_average(snow_depth_data, start, end)
+                    daily_snowfall = self._calculate_daily_sum(snowfall_data, start, end)
+                else:
+                    daily_humidity = daily_pressure = daily_snow_depth = daily_snowfall = None
+
                 if daily_snowfall is None:
-                    daily_snowfall = snowfall_sums[i] if i < len(snowfall_sums) else None
+                    daily_snowfall = snowfall_sums[i]
 
                 snow_6h = None
                 if date_str == today_str:
-                    snow_6h = self._calculate_last_hours_sum(
-                        hourly_data, 'snowfall', hourly_times, 6
-                    )
+                    snow_6h = self._calculate_last_hours_sum(snowfall_data, hourly_times, 6, now)
 
                 om_fields = {
                     'datetime': date_str,  # match existing VC records
@@ -153,7 +342,7 @@ class OpenMeteoFetcher:
                     'om_pressure': daily_pressure,
                     'om_wind_speed': daily_wind,
                     'om_elevation': self.elevation,
-                    'om_data_timestamp': datetime.now().isoformat(),
+                    'om_data_timestamp': data_timestamp,
 
                     # new snow fields
                     'om_snowfall': daily_snowfall,
@@ -168,25 +357,25 @@ class OpenMeteoFetcher:
                 # Clean fields (remove None values and ensure proper types)
                 cleaned_fields = {}
                 for k, v in om_fields.items():
-                    if v is not None and v != "":
-                        if k in ['om_temp', 'om_temp_f', 'om_humidity', 'om_pressure',
-                                 'om_wind_speed', 'om_wind_speed_mph', 'om_snow_depth']:
-                            cleaned_fields[k] = round(float(v), 1)
-                        elif k in ['om_weather_code', 'om_elevation']:
-                            cleaned_fields[k] = int(v)
-                        elif k in ['om_precipitation', 'om_snowfall', 'om_snowfall_6h']:
-                            cleaned_fields[k] = round(float(v), 2)
-                        else:
-                            cleaned_fields[k] = v
+                    if v is None or v == "":
+                        continue
+                    if k in _FIELDS_INT:
+                        cleaned_fields[k] = int(v)
+                    elif k in _FIELDS_ROUND1 and isinstance(v, (int, float)):
+                        cleaned_fields[k] = round(v, 1)
+                    elif k in _FIELDS_ROUND2 and isinstance(v, (int, float)):
+                        cleaned_fields[k] = round(v, 2)
+                    else:
+                        cleaned_fields[k] = v
 
                 records.append(cleaned_fields)
 
-            logger.info(f"Prepared {len(records)} Open-Meteo records for update",
+            logger.info("Prepared %s Open-Meteo records for update", len(records),
                        extra={'context': 'OpenMeteo Data Preparation'})
             return records
 
         except Exception as e:
-            logger.error(f"Error preparing Open-Meteo records: {e}",
+            logger.error("Error preparing Open-Meteo records: %s", e,
                         extra={'context': 'OpenMeteo Data Preparation Error'})
             raise
 
@@ -194,88 +383,71 @@ class OpenMeteoFetcher:
         """Backwards compatibility alias."""
         return self.prepare_records(data)
 
-    def _calculate_daily_sum(self, hourly_data: Dict, variable: str, hourly_times: List[str], target_date: str):
+    @staticmethod
+    def _hourly_day_ranges(hourly_times: List[str]) -> Dict[str, Tuple[int, int]]:
+        """
+        Map each date in hourly_times (sorted ISO strings) to its [start, end) index range
         """
-        Calculate daily sum from hourly data for a specific variable and date
+        ranges: Dict[str, Tuple[int, int]] = {}
+        for i, time_str in enumerate(hourly_times):
+            d = time_str[:10]
+            r = ranges.get(d)
+            ranges[d] = (r[0], i + 1) if r else (i, i + 1)
+        return ranges
+
+    def _calculate_daily_sum(self, variable_data: List, start: int, end: int):
+        """
+        Calculate daily sum of variable_data[start:end], ignoring missing values
         """
         try:
-            variable_data = hourly_data.get(variable, [])
-            if not variable_data or not hourly_times:
-                return None
-
-            total = 0.0
-            found = False
-            for i, time_str in enumerate(hourly_times):
-                if i < len(variable_data) and time_str.startswith(target_date):
-                    value = variable_data[i]
-                    if value is not None:
-                        total += float(value)
-                        found = True
-
-            return total if found else None
+            values = [v for v in variable_data[start:end] if v is not None]
+            return math.fsum(values) if values else None
 
         except Exception as e:
-            logger.warning(f"Error calculating daily sum for {variable}: {e}",
+            logger.warning("Error calculating daily sum: %s", e,
                          extra={'context': 'OpenMeteo Data Calculation'})
             return None
 
-    def _calculate_last_hours_sum(self, hourly_data: Dict, variable: str, hourly_times: List[str], hours: int):
+    def _calculate_last_hours_sum(self, variable_data: List, hourly_times: List[str], hours: int,
+                                  now: datetime = None):
         """
-        Calculate rolling sum over the last `hours` hours ending now
+        Calculate rolling sum of variable_data over the last `hours` hours ending at `now`
+        (naive FORECAST_TZ wall clock; defaults to the current time there)
         """
         try:
-            variable_data = hourly_data.get(variable, [])
             if not variable_data or not hourly_times:
                 return None
 
-            now = datetime.now()
+            if now is None:
+                now = datetime.now(_TZ).replace(tzinfo=None)
             window_start = now - timedelta(hours=hours)
 
-            total = 0.0
-            found = False
-            for i, time_str in enumerate(hourly_times):
-                if i >= len(variable_data):
-                    continue
-                try:
-                    t = datetime.fromisoformat(time_str)
-                except ValueError:
-                    continue
-                if window_start < t <= now:
-                    value = variable_data[i]
-                    if value is not None:
-                        total += float(value)
-                        found = True
-
-            return total if found else None
+            # hourly_times are sorted minute-resolution ISO strings ("YYYY-MM-DDTHH:MM"),
+            # which order like the datetimes they encode; bisect out the window
+            lo = bisect.bisect_right(hourly_times, window_start.strftime('%Y-%m-%dT%H:%M'))
+            hi = bisect.bisect_right(hourly_times, now.strftime('%Y-%m-%dT%H:%M'))
+            values = [v for v in variable_data[lo:hi] if v is not None]
+
+            return math.fsum(values) if values else None
 
         except Exception as e:
-            logger.warning(f"Error calculating last-{hours}h sum for {variable}: {e}",
+            logger.warning("Error calculating last-%sh sum: %s", hours, e,
                          extra={'context': 'OpenMeteo Data Calculation'})
             return None
 
-    def _calculate_daily_average(self, hourly_data: Dict, variable: str, hourly_times: List[str], target_date: str):
+    def _calculate_daily_average(self, variable_data: List, start: int, end: int):
         """
-        Calculate daily average from hourly data for a specific variable and date
+        Calculate daily average of variable_data[start:end], ignoring missing values
         """
         try:
-            variable_data = hourly_data.get(variable, [])
-            if not variable_data or not hourly_times:
-                return None
-
-            daily_values = []
-            for i, time_str in enumerate(hourly_times):
-                if i < len(variable_data) and time_str.startswith(target_date):
-                    value = variable_data[i]
-                    if value is not None:
-                        daily_values.append(float(value))
-
-            if not daily_values:
+            values = [v for v in variable_data[start:end] if v is not None]
+            if not values:
                 return None
 
-            return sum(daily_values) / len(daily_values)
+            return statistics.fmean(values)
 
         except Exception as e:
-            logger.warning(f"Error calculating daily average for {variable}: {e}",
+            logger.warning("Error calculating daily average: %s", e,
                          extra={'context': 'OpenMeteo Data Calculation'})
             return None
 
@@ -284,12 +456,21 @@ def test_openmeteo_fetch() -> bool:
     """
     Test function to verify Open-Meteo data retrieval and processing
     Returns True if successful, False otherwise
+
+    Set OPENMETEO_FIXTURE to a saved forecast JSON file to skip the network call.
     """
     try:
         print("🌤️  Testing Open-Meteo Weather Fetcher...")
         fetcher = OpenMeteoFetcher()
 
-        data = fetcher.get_weather_data()
+        fixture_path = os.environ.get('OPENMETEO_FIXTURE')
+        if fixture_path:
+            print(f"📁 Loading Open-Meteo fixture: {fixture_path}")
+            with open(fixture_path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson else json.loads(raw)
+        else:
+            data = fetcher.get_weather_data()
 
         if data:
             print(f"✅ Successfully fetched data from Open-Meteo")
@@ -319,4 +500,7 @@ def test_openmeteo_fetch() -> bool:
 
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
     test_openmeteo_fetch()
@@ -17,6 +17,7 @@ Requires:
 from __future__ import annotations
 
 import argparse
+import gzip
 import json
 import os
 import re
@@ -25,6 +26,11 @@ import urllib.request
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+try:
+    import orjson  # optional: faster (de)serialization of the base schema
+except ImportError:
+    orjson = None
+
 
 DEFAULT_BASE_ID = "appoTbBi5JDuMvJ9D"
 DEFAULT_TABLE_IDS = [
@@ -39,27 +45,34 @@ META_TABLES_URL = "https://api.airtable.com/v0/meta/bases/{base_id}/tables"
 def http_get_json(url: str, token: str) -> Dict[str, Any]:
     req = urllib.request.Request(url, method="GET")
     req.add_header("Authorization", f"Bearer {token}")
+    req.add_header("Accept-Encoding", "gzip")
     with urllib.request.urlopen(req, timeout=60) as resp:
-        return json.loads(resp.read())
+        raw = resp.read()
+        if resp.headers.get("Content-Encoding", "").lower() == "gzip":
+            raw = gzip.decompress(raw)
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+_RE_NONALNUM = re.compile(r"[^a-z0-9]+")
+_RE_MULTI_UNDER = re.compile(r"_+")
 
 
 def sanitize_filename(s: str) -> str:
     s = s.strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
+    s = _RE_NONALNUM.sub("_", s)
+    s = _RE_MULTI_UNDER.sub("_", s).strip("_")
     return s or "table"
 
 
 def write_json(path: str, obj: Any) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=2, sort_keys=True)
-
-
-def write_text(path: str, text: str) -> None:
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(text)
+    # Both paths emit the same text: 2-space indent, sorted keys, raw UTF-8
+    if orjson:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(obj, f, indent=2, sort_keys=True, ensure_ascii=False)
 
 
 def table_index(tables: List[Dict[str, Any]]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
@@ -156,6 +169,7 @@ def main() -> None:
 
     # Write per-table field inventories
     extracted_info = []
+    extracted_fields = []  # flat field lists, parallel to extracted_info
     for t in selected:
         tid = t.get("id") or "unknown"
         tname = t.get("name") or tid
@@ -173,6 +187,7 @@ def main() -> None:
             "fields_file_by_id": out_by_id,
             "fields_file_by_name": out_by_name,
         })
+        extracted_fields.append(flat)
 
     # Write manifest for drift tooling
     manifest = {
@@ -188,43 +203,38 @@ def main() -> None:
     write_json(manifest_path, manifest)
 
     # Write a human report
-    lines = []
-    lines.append("# Airtable Schema Probe Report\n")
-    lines.append(f"- Generated (UTC): `{now}`\n")
-    lines.append(f"- Base ID: `{base_id}`\n")
-    lines.append(f"- Raw base schema: `{base_schema_path}`\n")
-    lines.append(f"- Tables list: `{tables_path}`\n")
-    lines.append(f"- Manifest: `{manifest_path}`\n\n")
-
-    if missing:
-        lines.append("## Missing requested tables\n")
-        for m in missing:
-            lines.append(f"- {m}\n")
-        lines.append("\n")
-
-    lines.append("## Extracted tables\n")
-    for info in extracted_info:
-        lines.append(f"### {info['name']} ({info['id']})\n")
-        lines.append(f"- Field count: {info['field_count']}\n")
-        lines.append(f"- Fields (by id): `{info['fields_file_by_id']}`\n")
-        lines.append(f"- Fields (by name): `{info['fields_file_by_name']}`\n\n")
-
-        # Print a short field list inline for quick scanning
-        try:
-            with open(info["fields_file_by_id"], "r", encoding="utf-8") as f:
-                fld_list = json.load(f)
-            lines.append("| Field | Type |\n")
-            lines.append("|---|---|\n")
+    report_path = os.path.join(args.generated_dir, "AIRTABLE_SCHEMA_REPORT.md")
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as report:
+        w = report.write
+        w("# Airtable Schema Probe Report\n")
+        w(f"- Generated (UTC): `{now}`\n")
+        w(f"- Base ID: `{base_id}`\n")
+        w(f"- Raw base schema: `{base_schema_path}`\n")
+        w(f"- Tables list: `{tables_path}`\n")
+        w(f"- Manifest: `{manifest_path}`\n\n")
+
+        if missing:
+            w("## Missing requested tables\n")
+            for m in missing:
+                w(f"- {m}\n")
+            w("\n")
+
+        w("## Extracted tables\n")
+        for info, fld_list in zip(extracted_info, extracted_fields):
+            w(f"### {info['name']} ({info['id']})\n")
+            w(f"- Field count: {info['field_count']}\n")
+            w(f"- Fields (by id): `{info['fields_file_by_id']}`\n")
+            w(f"- Fields (by name): `{info['fields_file_by_name']}`\n\n")
+
+            # Print a short field list inline for quick scanning
+            w("| Field | Type |\n")
+            w("|---|---|\n")
             for fld in fld_list:
                 nm = fld.get("name", "")
                 ty = fld.get("type", "")
-                lines.append(f"| {nm} | {ty} |\n")
-            lines.append("\n")
-        except Exception as e:
-            lines.append(f"_Could not inline fields: {e}_\n\n")
-
-    report_path = os.path.join(args.generated_dir, "AIRTABLE_SCHEMA_REPORT.md")
-    write_text(report_path, "".join(lines))
+                w(f"| {nm} | {ty} |\n")
+            w("\n")
 
     print("OK: schema probe complete.")
     print(f"Wrote: {base_schema_path}")
@@ -4,7 +4,11 @@ import sys
 import csv
 import json
 import argparse
+import functools
 import subprocess
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
@@ -17,6 +21,8 @@ ZONES_ORDER = [
     "Den", "Guest Hall", "Laundry", "Guest Bath", "Entryway", "Guest Room"
 ]
 ZONE_KWH_FIELD = {z: f"{z} KWH (Auto)" for z in ZONES_ORDER}
+CSV_FIELDS = ("date_local", "wx_record_id", "zone", "recomputed_kwh",
+              "airtable_kwh_auto", "delta_kwh", "delta_pct", "status")
 
 def eprint(*a):
     print(*a, file=sys.stderr)
@@ -31,6 +37,12 @@ def parse_args():
     ap.add_argument("--abs-fail", type=float, default=0.50)
     ap.add_argument("--pct-warn", type=float, default=0.05)
     ap.add_argument("--pct-fail", type=float, default=0.15)
+    ap.add_argument(
+        "--max-workers", type=int, default=2,
+        help="Days to recompute concurrently. Each runs its own rollup process against "
+             "Airtable, which allows 5 requests/s per base and locks out for 30s on 429; "
+             "keep this small.",
+    )
     ap.add_argument("--rollup-script", default=os.path.expanduser("~/weather-fetcher/homeassistant/scripts/thermostat_rollup_write_yesterday.py"))
     return ap.parse_args()
 
@@ -62,35 +74,41 @@ def run_rollup_dry(rollup_script: str, date_iso: str):
     # Ensure we do NOT write. Your script already has dry-run default behavior in this mode.
     # If you later add a flag, we can pass it explicitly.
     cmd = [sys.executable, rollup_script, "--date-local", date_iso]
-    p = subprocess.run(cmd, capture_output=True, text=True, env=env)
-    out = p.stdout
-    err = p.stderr
-
-    if p.returncode != 0:
-        raise RuntimeError(f"Rollup failed for {date_iso} (exit={p.returncode}).\nSTDOUT:\n{out}\nSTDERR:\n{err}")
 
     wx_id = None
     kwh = {}
     in_kwh_block = False
-
-    for line in out.splitlines():
-        if line.startswith("wx_record_id:"):
-            wx_id = line.split(":", 1)[1].strip()
-        if line.strip() in ("kwh_yesterday_by_zone:", "kwh_by_zone:"):
-            in_kwh_block = True
-            continue
-        if in_kwh_block:
-            if not line.startswith("- "):
-                # end of block
-                in_kwh_block = False
-                continue
-            # "- Stairs: 1.868"
-            try:
-                body = line[2:]
-                zone, val = body.split(":", 1)
-                kwh[zone.strip()] = float(val.strip())
-            except Exception:
-                continue
+    # Parse stdout as it streams; keep only a tail for error reports. stderr goes
+    # to a temp file so a chatty child can't fill its pipe and deadlock us.
+    out_tail = deque(maxlen=200)
+
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as err_f:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err_f, text=True, env=env, bufsize=1) as p:
+            for line in p.stdout:
+                line = line.rstrip("\n")
+                out_tail.append(line)
+                if line.startswith("wx_record_id:"):
+                    wx_id = line.split(":", 1)[1].strip()
+                if line.strip() in ("kwh_yesterday_by_zone:", "kwh_by_zone:"):
+                    in_kwh_block = True
+                    continue
+                if in_kwh_block:
+                    if not line.startswith("- "):
+                        # end of block
+                        in_kwh_block = False
+                        continue
+                    # "- Stairs: 1.868"
+                    try:
+                        body = line[2:]
+                        zone, val = body.split(":", 1)
+                        kwh[zone.strip()] = float(val.strip())
+                    except Exception:
+                        continue
+
+        if p.returncode != 0:
+            err_f.seek(0)
+            out = "\n".join(out_tail)
+            raise RuntimeError(f"Rollup failed for {date_iso} (exit={p.returncode}).\nSTDOUT:\n{out}\nSTDERR:\n{err_f.read()}")
 
     if not wx_id:
         raise RuntimeError(f"Could not parse wx_record_id from rollup output for {date_iso}.")
@@ -100,17 +118,54 @@ def run_rollup_dry(rollup_script: str, date_iso: str):
 
     return wx_id, kwh
 
-def airtable_get_wx_fields(wx_record_id: str):
+@functools.lru_cache(maxsize=None)
+def airtable_session():
+    """Shared keep-alive session (one pooled connection per worker thread)."""
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry))
+    return session
+
+def airtable_get_wx_fields_batch(wx_record_ids, chunk_size: int = 50):
+    """
+    Fetch the zone KWH (Auto) fields for many WX records via listRecords,
+    ceil(N/chunk_size) requests instead of one GET per record.
+    Returns: dict record_id -> fields
+    """
     token = os.getenv("AIRTABLE_TOKEN")
     if not token:
         raise RuntimeError("AIRTABLE_TOKEN is required for drift check.")
 
-    url = f"https://api.airtable.com/v0/{BASE_ID}/{TBL_WX}/{wx_record_id}"
+    url = f"https://api.airtable.com/v0/{BASE_ID}/{TBL_WX}"
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-    r = requests.get(url, headers=headers, timeout=30)
-    r.raise_for_status()
-    return r.json().get("fields", {})
+    wanted = list(dict.fromkeys(wx_record_ids))
+    by_id = {}
+
+    for i in range(0, len(wanted), chunk_size):
+        chunk = wanted[i:i + chunk_size]
+        params = {
+            "filterByFormula": "OR(" + ",".join(f"RECORD_ID()='{rid}'" for rid in chunk) + ")",
+            "fields[]": [ZONE_KWH_FIELD[z] for z in ZONES_ORDER],
+        }
+        while True:
+            r = airtable_session().get(url, headers=headers, params=params, timeout=30)
+            r.raise_for_status()
+            data = r.json()
+            for rec in data.get("records", []):
+                by_id[rec["id"]] = rec.get("fields", {})
+            offset = data.get("offset")
+            if not offset:
+                break
+            params["offset"] = offset
+
+    missing = [rid for rid in wanted if rid not in by_id]
+    if missing:
+        raise RuntimeError(f"WX records not found in Airtable: {', '.join(missing)}")
+    return by_id
 
 def classify(delta_abs: float, delta_pct: float, abs_warn: float, abs_fail: float, pct_warn: float, pct_fail: float):
     if delta_abs >= abs_fail or delta_pct >= pct_fail:
@@ -137,58 +192,61 @@ def main():
     csv_path = os.path.join(out_dir, f"thermostat_kwh_drift_{start_iso}_{end_iso}.csv")
     md_path  = os.path.join(out_dir, f"thermostat_kwh_drift_{start_iso}_{end_iso}.md")
 
-    rows = []
     day_summaries = []
 
-    for d in dates:
-        wx_id, recomputed = run_rollup_dry(a.rollup_script, d)
-        fields = airtable_get_wx_fields(wx_id)
-
-        max_abs = 0.0
-        max_pct = 0.0
-        worst = None
-        statuses = {"OK": 0, "WARN": 0, "FAIL": 0}
-
-        for z in ZONES_ORDER:
-            f = ZONE_KWH_FIELD[z]
-            airtable_val = fields.get(f, None)
-            # Airtable may store as int/float or be missing
-            airtable_kwh = float(airtable_val) if airtable_val is not None else 0.0
-            rec_kwh = float(recomputed.get(z, 0.0))
-            delta = rec_kwh - airtable_kwh
-            delta_abs = abs(delta)
-            denom = airtable_kwh if airtable_kwh != 0 else (rec_kwh if rec_kwh != 0 else 1.0)
-            delta_pct = (delta_abs / denom) if denom else 0.0
-
-            st = classify(delta_abs, delta_pct, a.abs_warn, a.abs_fail, a.pct_warn, a.pct_fail)
-            statuses[st] += 1
-
-            if delta_abs > max_abs or (delta_abs == max_abs and delta_pct > max_pct):
-                max_abs = delta_abs
-                max_pct = delta_pct
-                worst = z
-
-            rows.append({
-                "date_local": d,
-                "wx_record_id": wx_id,
-                "zone": z,
-                "recomputed_kwh": f"{rec_kwh:.3f}",
-                "airtable_kwh_auto": f"{airtable_kwh:.3f}",
-                "delta_kwh": f"{delta:.3f}",
-                "delta_pct": f"{(delta_pct*100):.2f}",
-                "status": st,
-            })
-
-        day_status = "FAIL" if statuses["FAIL"] else ("WARN" if statuses["WARN"] else "OK")
-        day_summaries.append((d, wx_id, day_status, worst, max_abs, max_pct))
-
-        print(f"{d} wx={wx_id} status={day_status} worst={worst} max_abs={max_abs:.3f} max_pct={(max_pct*100):.2f}%")
-
-    # Write CSV
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
-        w.writeheader()
-        w.writerows(rows)
+    # Rollup subprocesses are I/O-bound; overlap them per day.
+    # map() keeps date order so the report is unchanged.
+    with ThreadPoolExecutor(max_workers=max(1, a.max_workers)) as pool:
+        rollups = list(pool.map(lambda d: run_rollup_dry(a.rollup_script, d), dates))
+
+    wx_fields = airtable_get_wx_fields_batch([wx_id for wx_id, _ in rollups])
+
+    # Rows stream straight to the CSV as each day is compared
+    with open(csv_path, "w", newline="", encoding="utf-8") as csv_f:
+        w = csv.writer(csv_f)
+        w.writerow(CSV_FIELDS)
+
+        for d, (wx_id, recomputed) in zip(dates, rollups):
+            fields = wx_fields[wx_id]
+            max_abs = 0.0
+            max_pct = 0.0
+            worst = None
+            statuses = {"OK": 0, "WARN": 0, "FAIL": 0}
+
+            for z in ZONES_ORDER:
+                f = ZONE_KWH_FIELD[z]
+                airtable_val = fields.get(f, None)
+                # Airtable may store as int/float or be missing
+                airtable_kwh = float(airtable_val) if airtable_val is not None else 0.0
+                rec_kwh = float(recomputed.get(z, 0.0))
+                delta = rec_kwh - airtable_kwh
+                delta_abs = abs(delta)
+                denom = airtable_kwh if airtable_kwh != 0 else (rec_kwh if rec_kwh != 0 else 1.0)
+                delta_pct = (delta_abs / denom) if denom else 0.0
+
+                st = classify(delta_abs, delta_pct, a.abs_warn, a.abs_fail, a.pct_warn, a.pct_fail)
+                statuses[st] += 1
+
+                if delta_abs > max_abs or (delta_abs == max_abs and delta_pct > max_pct):
+                    max_abs = delta_abs
+                    max_pct = delta_pct
+                    worst = z
+
+                w.writerow((
+                    d,
+                    wx_id,
+                    z,
+                    f"{rec_kwh:.3f}",
+                    f"{airtable_kwh:.3f}",
+                    f"{delta:.3f}",
+                    f"{(delta_pct*100):.2f}",
+                    st,
+                ))
+
+            day_status = "FAIL" if statuses["FAIL"] else ("WARN" if statuses["WARN"] else "OK")
+            day_summaries.append((d, wx_id, day_status, worst, max_abs, max_pct))
+
+            print(f"{d} wx={wx_id} status={day_status} worst={worst} max_abs={max_abs:.3f} max_pct={(max_pct*100):.2f}%")
 
     # Write MD summary
     fail_days = [x for x in day_summaries if x[2] == "FAIL"]
@@ -63,6 +63,10 @@ class WeatherDataFetcher:
                 logger.error(f"API Response: {response.text}")
             raise
 
+# How long a fetched WX table snapshot is reused within one process
+EXISTING_RECORDS_TTL = 300
+
+
 class AirtableAPI:
     # Add these methods to your existing AirtableAPI class in weather_fetcher.py
 
@@ -81,6 +85,7 @@ class AirtableAPI:
             existing_records = self.get_existing_records()
             logger.info(f"Found {len(existing_records)} existing VC records for OM update", 
                        extra={'context': 'OpenMeteo Update'})
+            existing_by_id = {r['id']: r for r in existing_records.values()}
     
             records_to_update = []
             matched_count = 0
@@ -123,6 +128,14 @@ class AirtableAPI:
             # Update records in batches
             if records_to_update:
                 success = self._batch_update_openmeteo(records_to_update)
+                if success:
+                    # Keep the cached snapshot in step with what was just written
+                    for update_record in records_to_update:
+                        cached = existing_by_id.get(update_record['id'])
+                        if cached is not None:
+                            cached['fields'].update(update_record['fields'])
+                else:
+                    self.invalidate_existing_records()
                 if success:
                     logger.info(f"Successfully updated {len(records_to_update)} records with Open-Meteo data", 
                                extra={'context': 'OpenMeteo Update'})
@@ -213,9 +226,22 @@ class AirtableAPI:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        self._existing_records = None
+        self._existing_records_at = 0.0
         logger.info("Initialized Airtable API")
 
+    def invalidate_existing_records(self) -> None:
+        self._existing_records = None
+
     def get_existing_records(self) -> Dict[str, Dict]:
+        """
+        Return all WX records keyed by datetime.  The snapshot is reused for
+        EXISTING_RECORDS_TTL seconds so the OM update and the comparison
+        stats that follow it share a single table scan.
+        """
+        if (self._existing_records is not None
+                and time.monotonic() - self._existing_records_at < EXISTING_RECORDS_TTL):
+            return self._existing_records
         existing_records = {}
         url = self.weather_api_url
         try:
@@ -235,6 +261,8 @@ class AirtableAPI:
                 else:
                     break
             logger.info(f"Found {len(existing_records)} existing records")
+            self._existing_records = existing_records
+            self._existing_records_at = time.monotonic()
             return existing_records
         except Exception as e:
             logger.error(f"Error fetching existing records: {e}")
@@ -319,6 +347,8 @@ class AirtableAPI:
                 records_to_create.append(record)
 
         success = True
+        if records_to_create or records_to_update:
+            self.invalidate_existing_records()
         if records_to_create:
             logger.info(f"Creating {len(records_to_create)} new records")
             success = success and self._batch_create(records_to_create)